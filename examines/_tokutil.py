@@ -0,0 +1,133 @@
+"""Shared token counting (and GeoJSON pretty-printing) for the examine scripts.
+
+The tiktoken encoding is loaded lazily on first use and memoized, so the
+BPE table is parsed once per process even when several examines run
+back-to-back from one driver.  Exact counts are also persisted in
+``examines/.tokcache`` (keyed by encoding and text hash), so re-running
+an examine on unchanged inputs skips tokenization altogether.  Without
+tiktoken, counts fall back to a character heuristic (1 token ≈ 4
+characters of English text).  GeoJSON is pretty-printed with orjson when
+it is installed.
+"""
+
+import atexit
+import dbm
+import functools
+import hashlib
+import json
+import os
+import shelve
+
+try:
+    import orjson
+except ImportError:  # optional: faster GeoJSON serialization
+    orjson = None
+
+_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".tokcache")
+
+
+@functools.lru_cache(maxsize=1)
+def _has_tiktoken() -> bool:
+    try:
+        import tiktoken  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=4)
+def get_encoding(model: str = "gpt-4"):
+    """Return the (cached) tiktoken encoding for *model*."""
+    import tiktoken
+    return tiktoken.encoding_for_model(model)
+
+
+@functools.lru_cache(maxsize=1)
+def _token_method() -> str:
+    if _has_tiktoken():
+        return f"tiktoken ({get_encoding().name})"
+    return "character heuristic (len/4)"
+
+
+# text -> token count, oldest first; the same constants are counted by
+# several examines (and again on every interactive re-run).
+_counts: dict[str, int] = {}
+_MAX_CACHED = 256
+
+
+@functools.lru_cache(maxsize=1)
+def _disk_cache():
+    """Open the on-disk count cache, or return None if it can't be used."""
+    try:
+        db = shelve.open(_CACHE_PATH)
+    except (OSError, dbm.error):
+        return None
+    atexit.register(db.close)
+    return db
+
+
+def _encode_counts(texts: list[str]) -> list[int]:
+    # The corpora are plain text with no <|...|> markers, so skip the
+    # special-token scan; switch back to encode_batch if that changes.
+    # encode_ordinary_batch fans out over a thread pool (the Rust core
+    # releases the GIL); more workers than texts would only sit idle.
+    workers = min(len(texts), os.cpu_count() or 1)
+    ids = get_encoding().encode_ordinary_batch(texts, num_threads=workers)
+    return [len(t) for t in ids]
+
+
+def _count_uncached(texts: list[str]) -> list[int]:
+    if not _has_tiktoken():
+        return [max(1, len(text) // 4) for text in texts]
+    db = _disk_cache()
+    if db is None:
+        return _encode_counts(texts)
+    name = get_encoding().name
+    keys = [f"{name}:{hashlib.sha256(t.encode()).hexdigest()}" for t in texts]
+    todo = [i for i, key in enumerate(keys) if key not in db]
+    if todo:
+        for i, n in zip(todo, _encode_counts([texts[i] for i in todo])):
+            db[keys[i]] = n
+    return [db[key] for key in keys]
+
+
+def count_tokens_many(texts: list[str]) -> list[int]:
+    """Count tokens for each of *texts*, encoding unseen ones in one batch."""
+    missing = [t for t in dict.fromkeys(texts) if t not in _counts]
+    if missing:
+        _counts.update(zip(missing, _count_uncached(missing)))
+    counts = [_counts[t] for t in texts]
+    while len(_counts) > _MAX_CACHED:
+        del _counts[next(iter(_counts))]
+    return counts
+
+
+def count_tokens(text: str) -> int:
+    return count_tokens_many([text])[0]
+
+
+def text_stats_many(texts: list[str]) -> list[tuple[int, int, int]]:
+    """Return ``(tokens, chars, lines)`` for each of *texts*.
+
+    Tokens come from one batched count; ``len`` is O(1) on str and
+    ``str.count`` is a single C scan, so nothing else re-walks the text.
+    """
+    return [
+        (tokens, len(text), text.count("\n") + 1)
+        for text, tokens in zip(texts, count_tokens_many(texts))
+    ]
+
+
+def pretty_json(obj) -> str:
+    """Serialize *obj* as JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def __getattr__(name: str):
+    # TOKEN_METHOD is computed on first access so importing this module
+    # never loads the encoding by itself.
+    if name == "TOKEN_METHOD":
+        return _token_method()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
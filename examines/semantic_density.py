@@ -4,28 +4,18 @@ While token_comparison.py counts raw tokens, this script measures
 how many distinct, extractable semantic facts each format encodes
 and computes a "semantic density" score.
 
-No external dependencies required (tiktoken optional for exact counts).
+No external dependencies required (tiktoken optional for exact counts;
+orjson optional for faster GeoJSON serialization).
 """
 
 import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-import json
+import functools
+import io
 import geon
-
-# ── Token counting ────────────────────────────────────────────────────────
-
-try:
-    import tiktoken
-    _enc = tiktoken.encoding_for_model("gpt-4")
-    def count_tokens(text: str) -> int:
-        return len(_enc.encode(text))
-    TOKEN_METHOD = "tiktoken (cl100k_base)"
-except ImportError:
-    def count_tokens(text: str) -> int:
-        return max(1, len(text) // 4)
-    TOKEN_METHOD = "character heuristic (len/4)"
-
+import _tokutil
+from _tokutil import count_tokens_many, pretty_json
 
 # ── Define semantic fact categories ───────────────────────────────────────
 
@@ -165,7 +155,7 @@ GEOJSON_OBJ = {
         "updated": "2025-01-15T10:00:00Z",
     },
 }
-GEOJSON_TEXT = json.dumps(GEOJSON_OBJ, indent=2)
+GEOJSON_TEXT = pretty_json(GEOJSON_OBJ)
 
 # 3. OSM-style tags (flat key-value)
 OSM_TAGS = """\
@@ -189,6 +179,8 @@ bcc:vs-001,"Victoria Square, Birmingham",public_space,52.4791,-1.9024,7500,150,"
 
 # ── Analysis ──────────────────────────────────────────────────────────────
 
+ROW_FMT = "{name:<14} {tokens:>8} {facts:>7} {tpf:>9.1f} {density:>9.1f}% {structured:>11}"
+
 representations = [
     ("GEON",           GEON_TEXT,    TOTAL_FACTS),
     ("GeoJSON",        GEOJSON_TEXT, TOTAL_FACTS),
@@ -196,48 +188,57 @@ representations = [
     ("CSV row",        CSV_ROW,       9),  # CSV loses most semantic structure
 ]
 
-print("=" * 80)
-print("SEMANTIC DENSITY ANALYSIS")
-print(f"Tokenizer: {TOKEN_METHOD}")
-print(f"Total extractable facts in source data: {TOTAL_FACTS}")
-print("=" * 80)
-print()
-
-# Fact category breakdown
-print("FACT CATEGORIES:")
-for cat, facts in FACT_CATEGORIES.items():
-    print(f"  {cat:<14} {len(facts):>2} facts: {', '.join(facts)}")
-print(f"  {'TOTAL':<14} {TOTAL_FACTS:>2}")
-print()
-
-# Comparison table
-print(f"{'Format':<14} {'Tokens':>8} {'Facts':>7} {'Tok/fact':>9} {'Semantic':>10} {'Structured':>11}")
-print(f"{'':14} {'':>8} {'':>7} {'':>9} {'density':>10} {'':>11}")
-print("-" * 70)
-
-for name, text, facts in representations:
-    tokens = count_tokens(text)
-    tpf = tokens / facts if facts else 0
-    density = facts / tokens * 100 if tokens else 0  # facts per 100 tokens
-    structured = "Yes" if name in ("GEON", "GeoJSON") else "Partial"
-    print(f"{name:<14} {tokens:>8} {facts:>7} {tpf:>9.1f} {density:>9.1f}% {structured:>11}")
-
-print()
-print("-" * 70)
-print()
-print("INTERPRETATION:")
-print()
-print("  Semantic density = extractable facts per 100 tokens")
-print()
-print("  Higher is better: more spatial intelligence per token spent.")
-print()
-print("  GEON achieves the highest semantic density among structured formats")
-print("  because its syntax overhead is minimal (no braces, no quotes on keys,")
-print("  no commas between values).")
-print()
-print("  OSM tags are compact but LOSSY — they cannot represent experiential")
-print("  qualities, temporal patterns, or confidence levels in their standard")
-print("  tag schema.")
-print()
-print("  CSV is the most compact per-row but DESTROYS hierarchical structure,")
-print("  loses most semantic fields, and requires external schema documentation.")
+# Buffer the report; it is written to stdout in one call at the end.
+_report = io.StringIO()
+out = functools.partial(print, file=_report)
+
+try:
+    out("=" * 80)
+    out("SEMANTIC DENSITY ANALYSIS")
+    out(f"Tokenizer: {_tokutil.TOKEN_METHOD}")
+    out(f"Total extractable facts in source data: {TOTAL_FACTS}")
+    out("=" * 80)
+    out()
+
+    # Fact category breakdown
+    out("FACT CATEGORIES:")
+    for cat, facts in FACT_CATEGORIES.items():
+        out(f"  {cat:<14} {len(facts):>2} facts: {', '.join(facts)}")
+    out(f"  {'TOTAL':<14} {TOTAL_FACTS:>2}")
+    out()
+
+    # Comparison table
+    out(f"{'Format':<14} {'Tokens':>8} {'Facts':>7} {'Tok/fact':>9} {'Semantic':>10} {'Structured':>11}")
+    out(f"{'':14} {'':>8} {'':>7} {'':>9} {'density':>10} {'':>11}")
+    out("-" * 70)
+
+    token_counts = count_tokens_many([text for _, text, _ in representations])
+
+    for (name, text, facts), tokens in zip(representations, token_counts):
+        tpf = tokens / facts if facts else 0
+        density = facts / tokens * 100 if tokens else 0  # facts per 100 tokens
+        structured = "Yes" if name in ("GEON", "GeoJSON") else "Partial"
+        out(ROW_FMT.format(name=name, tokens=tokens, facts=facts, tpf=tpf,
+                           density=density, structured=structured))
+
+    out()
+    out("-" * 70)
+    out()
+    out("INTERPRETATION:")
+    out()
+    out("  Semantic density = extractable facts per 100 tokens")
+    out()
+    out("  Higher is better: more spatial intelligence per token spent.")
+    out()
+    out("  GEON achieves the highest semantic density among structured formats")
+    out("  because its syntax overhead is minimal (no braces, no quotes on keys,")
+    out("  no commas between values).")
+    out()
+    out("  OSM tags are compact but LOSSY — they cannot represent experiential")
+    out("  qualities, temporal patterns, or confidence levels in their standard")
+    out("  tag schema.")
+    out()
+    out("  CSV is the most compact per-row but DESTROYS hierarchical structure,")
+    out("  loses most semantic fields, and requires external schema documentation.")
+finally:
+    sys.stdout.write(_report.getvalue())
@@ -16,28 +16,20 @@ Requirements (optional — falls back to word-count heuristic):
 import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+import functools
+import io
 import json
 import textwrap
 
 import geon
+import _tokutil
+from _tokutil import pretty_json, text_stats_many
 
-# ── Token counting ────────────────────────────────────────────────────────
-
-try:
-    import tiktoken
-    _enc = tiktoken.encoding_for_model("gpt-4")
-
-    def count_tokens(text: str) -> int:
-        return len(_enc.encode(text))
-
-    TOKEN_METHOD = "tiktoken (cl100k_base — GPT-4 / Claude-compatible BPE)"
-except ImportError:
-    def count_tokens(text: str) -> int:
-        # Rough approximation: 1 token ≈ 4 characters for English text
-        return max(1, len(text) // 4)
-
-    TOKEN_METHOD = "character heuristic (len/4) — install tiktoken for exact counts"
-
+# This report has always spelled the tokenizer out in full.
+_TOKEN_METHOD_LABELS = {
+    "tiktoken (cl100k_base)": "tiktoken (cl100k_base — GPT-4 / Claude-compatible BPE)",
+    "character heuristic (len/4)": "character heuristic (len/4) — install tiktoken for exact counts",
+}
 
 # ── Prepare the same data in multiple formats ─────────────────────────────
 
@@ -170,7 +162,7 @@ GEOJSON_OBJ = {
         "updated": "2025-01-20T09:00:00Z",
     },
 }
-GEOJSON_TEXT = json.dumps(GEOJSON_OBJ, indent=2)
+GEOJSON_TEXT = pretty_json(GEOJSON_OBJ)
 GEOJSON_COMPACT = json.dumps(GEOJSON_OBJ, separators=(",", ":"))
 
 # --- 3. WKT + separate metadata (how WKT is typically used) ---
@@ -250,113 +242,124 @@ formats = [
     ("Natural language",        NATURAL_LANG),
 ]
 
-print("=" * 72)
-print("GEON TOKEN COMPARISON")
-print(f"Tokenizer: {TOKEN_METHOD}")
-print("=" * 72)
-print()
-
-results = []
-for name, text in formats:
-    tokens = count_tokens(text)
-    chars = len(text)
-    lines = text.count("\n") + 1
-    results.append((name, tokens, chars, lines))
-
-# Table header
-print(f"{'Format':<25} {'Tokens':>8} {'Chars':>8} {'Lines':>6} {'Tokens/line':>12}")
-print("-" * 72)
-
-geon_tokens = results[0][1]
-for name, tokens, chars, lines in results:
-    tpl = tokens / lines if lines else 0
-    ratio = tokens / geon_tokens if geon_tokens else 0
-    marker = "" if name == "GEON" else f"  ({ratio:.2f}x GEON)"
-    print(f"{name:<25} {tokens:>8} {chars:>8} {lines:>6} {tpl:>12.1f}{marker}")
-
-print()
-print("-" * 72)
-
-# ── Semantic density analysis ─────────────────────────────────────────────
-
-print()
-print("SEMANTIC DENSITY ANALYSIS")
-print("=" * 72)
-print()
-
-# Count distinct semantic facts in the GEON version
-semantic_fields = [
-    "place name", "type", "id", "location", "boundary (5 points)", "area",
-    "elevation", "4 purposes", "7 experience qualities", "4 character traits",
-    "4 adjacencies", "3 connectivity attributes", "3 temporal patterns",
-    "3 sources", "3 confidence ratings", "updated timestamp",
-]
-n_facts = len(semantic_fields)
-print(f"Distinct semantic facts encoded: {n_facts}")
-print(f"Fields: {', '.join(semantic_fields)}")
-print()
-
-print(f"{'Format':<25} {'Tokens':>8} {'Facts':>7} {'Tokens/fact':>12} {'Has structure':>14}")
-print("-" * 72)
-
-# All formats encode the same facts (except raw coords which is incomplete)
-fact_counts = {
-    "GEON":                 n_facts,
-    "GeoJSON (pretty)":     n_facts,
-    "GeoJSON (compact)":    n_facts,
-    "WKT + metadata":       n_facts,
-    "Raw coordinates only": 4,   # Only name, location, boundary, area
-    "Natural language":     n_facts,
-}
+# Row templates for the two result tables.
+SIZE_ROW = "{name:<25} {tokens:>8} {chars:>8} {lines:>6} {tpl:>12.1f}{marker}"
+FACT_ROW = "{name:<25} {tokens:>8} {facts:>7} {tpf:>12.1f} {structured:>14}"
 
-for name, tokens, chars, lines in results:
-    facts = fact_counts[name]
-    tpf = tokens / facts
-    structured = "Yes" if name not in ("Natural language", "Raw coordinates only") else "No"
-    print(f"{name:<25} {tokens:>8} {facts:>7} {tpf:>12.1f} {structured:>14}")
-
-print()
-print("-" * 72)
-print()
-print("KEY FINDINGS:")
-print()
-print("1. GEON uses significantly fewer tokens than GeoJSON for the SAME data")
-print("   because it avoids JSON structural overhead (braces, quotes, commas).")
-print()
-print("2. GEON maintains structured, parseable format while approaching the")
-print("   token efficiency of raw text.")
-print()
-print("3. Compact GeoJSON saves characters but NOT many tokens — tokenizers")
-print("   still process each structural character.")
-print()
-print("4. Natural language requires similar tokens but LOSES structure,")
-print("   making programmatic extraction unreliable.")
-print()
-print("5. GEON's token-per-semantic-fact ratio is the best among structured")
-print("   formats, meaning more spatial intelligence per context window.")
-
-
-# ── Scaling analysis ──────────────────────────────────────────────────────
-
-print()
-print()
-print("SCALING: What fits in a context window?")
-print("=" * 72)
-print()
-
-avg_geon_tokens = results[0][1]       # tokens for 1 GEON place
-avg_geojson_tokens = results[1][1]    # tokens for 1 GeoJSON feature
-
-for window_name, window_size in [
-    ("8K (GPT-3.5)",       8_192),
-    ("32K",               32_768),
-    ("128K (GPT-4 Turbo)", 128_000),
-    ("200K (Claude)",      200_000),
-    ("1M (Gemini)",      1_000_000),
-]:
-    geon_places = window_size // avg_geon_tokens
-    geojson_places = window_size // avg_geojson_tokens
-    advantage = geon_places / geojson_places if geojson_places else 0
-    print(f"  {window_name:<22}  GEON: ~{geon_places:>5} places   "
-          f"GeoJSON: ~{geojson_places:>5} places   "
-          f"({advantage:.1f}x more with GEON)")
+# Build the report in memory and write it out with a single call at the end.
+_report = io.StringIO()
+out = functools.partial(print, file=_report)
+
+try:
+    out("=" * 72)
+    out("GEON TOKEN COMPARISON")
+    out(f"Tokenizer: {_TOKEN_METHOD_LABELS.get(_tokutil.TOKEN_METHOD, _tokutil.TOKEN_METHOD)}")
+    out("=" * 72)
+    out()
+
+    names, texts = zip(*formats)
+    results = [
+        (name, *stats) for name, stats in zip(names, text_stats_many(list(texts)))
+    ]
+
+    # Table header
+    out(f"{'Format':<25} {'Tokens':>8} {'Chars':>8} {'Lines':>6} {'Tokens/line':>12}")
+    out("-" * 72)
+
+    geon_tokens = results[0][1]
+    for name, tokens, chars, lines in results:
+        tpl = tokens / lines if lines else 0
+        ratio = tokens / geon_tokens if geon_tokens else 0
+        marker = "" if name == "GEON" else f"  ({ratio:.2f}x GEON)"
+        out(SIZE_ROW.format(name=name, tokens=tokens, chars=chars, lines=lines,
+                            tpl=tpl, marker=marker))
+
+    out()
+    out("-" * 72)
+
+    # ── Semantic density analysis ─────────────────────────────────────────────
+
+    out()
+    out("SEMANTIC DENSITY ANALYSIS")
+    out("=" * 72)
+    out()
+
+    # Count distinct semantic facts in the GEON version
+    semantic_fields = [
+        "place name", "type", "id", "location", "boundary (5 points)", "area",
+        "elevation", "4 purposes", "7 experience qualities", "4 character traits",
+        "4 adjacencies", "3 connectivity attributes", "3 temporal patterns",
+        "3 sources", "3 confidence ratings", "updated timestamp",
+    ]
+    n_facts = len(semantic_fields)
+    out(f"Distinct semantic facts encoded: {n_facts}")
+    out(f"Fields: {', '.join(semantic_fields)}")
+    out()
+
+    out(f"{'Format':<25} {'Tokens':>8} {'Facts':>7} {'Tokens/fact':>12} {'Has structure':>14}")
+    out("-" * 72)
+
+    # All formats encode the same facts (except raw coords which is incomplete)
+    fact_counts = {
+        "GEON":                 n_facts,
+        "GeoJSON (pretty)":     n_facts,
+        "GeoJSON (compact)":    n_facts,
+        "WKT + metadata":       n_facts,
+        "Raw coordinates only": 4,   # Only name, location, boundary, area
+        "Natural language":     n_facts,
+    }
+
+    for name, tokens, chars, lines in results:
+        facts = fact_counts[name]
+        tpf = tokens / facts
+        structured = "Yes" if name not in ("Natural language", "Raw coordinates only") else "No"
+        out(FACT_ROW.format(name=name, tokens=tokens, facts=facts, tpf=tpf,
+                            structured=structured))
+
+    out()
+    out("-" * 72)
+    out()
+    out("KEY FINDINGS:")
+    out()
+    out("1. GEON uses significantly fewer tokens than GeoJSON for the SAME data")
+    out("   because it avoids JSON structural overhead (braces, quotes, commas).")
+    out()
+    out("2. GEON maintains structured, parseable format while approaching the")
+    out("   token efficiency of raw text.")
+    out()
+    out("3. Compact GeoJSON saves characters but NOT many tokens — tokenizers")
+    out("   still process each structural character.")
+    out()
+    out("4. Natural language requires similar tokens but LOSES structure,")
+    out("   making programmatic extraction unreliable.")
+    out()
+    out("5. GEON's token-per-semantic-fact ratio is the best among structured")
+    out("   formats, meaning more spatial intelligence per context window.")
+
+
+    # ── Scaling analysis ──────────────────────────────────────────────────────
+
+    out()
+    out()
+    out("SCALING: What fits in a context window?")
+    out("=" * 72)
+    out()
+
+    avg_geon_tokens = results[0][1]       # tokens for 1 GEON place
+    avg_geojson_tokens = results[1][1]    # tokens for 1 GeoJSON feature
+
+    for window_name, window_size in [
+        ("8K (GPT-3.5)",       8_192),
+        ("32K",               32_768),
+        ("128K (GPT-4 Turbo)", 128_000),
+        ("200K (Claude)",      200_000),
+        ("1M (Gemini)",      1_000_000),
+    ]:
+        geon_places = window_size // avg_geon_tokens
+        geojson_places = window_size // avg_geojson_tokens
+        advantage = geon_places / geojson_places if geojson_places else 0
+        out(f"  {window_name:<22}  GEON: ~{geon_places:>5} places   "
+            f"GeoJSON: ~{geojson_places:>5} places   "
+            f"({advantage:.1f}x more with GEON)")
+finally:
+    sys.stdout.write(_report.getvalue())
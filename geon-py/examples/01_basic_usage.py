@@ -1,13 +1,16 @@
 """Basic GEON usage: create, generate, parse, and validate.
 
-No external dependencies required.
+No external dependencies required (orjson is used for the JSON dump if installed).
 """
 
-import sys, os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
+import sys
 import geon
 
+try:
+    import orjson  # optional: pip install orjson
+except ImportError:
+    orjson = None
+
 # ── 1. Build a GeonPlace programmatically ─────────────────────────────────
 
 place = geon.GeonPlace(
@@ -80,5 +83,11 @@ print()
 
 geojson = geon.to_geojson(parsed)
 print("=== GeoJSON ===")
-import json
-print(json.dumps(geojson, indent=2))
+if orjson is not None:
+    # orjson already returns UTF-8 bytes; write them straight to the
+    # underlying buffer (after flushing any pending text output).
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(geojson, option=orjson.OPT_INDENT_2) + b"\n")
+else:
+    import json
+    print(json.dumps(geojson, indent=2))
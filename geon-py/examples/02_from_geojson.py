@@ -6,9 +6,6 @@ including FeatureCollections.
 No external dependencies required.
 """
 
-import sys, os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
 import json
 import geon
 
@@ -78,5 +75,5 @@ print()
 # ── 4. Round-trip: GeoJSON → GEON → GeoJSON ──────────────────────────────
 
 print("=== Round-trip: GEON -> GeoJSON ===")
-back = geon.to_geojson_string(places, indent=2)
+back = geon.to_geojson_string(places, indent=2, fast=True)
 print(back)
@@ -4,30 +4,91 @@ Uses the Overpass API to query OSM data directly.
 
 Requirements:
     pip install requests
+    pip install requests-cache  (optional, caches responses on disk for a day)
+    pip install orjson          (optional, faster response parsing)
     (or: pip install geon[osm])
 """
 
 import sys, os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
-import json
 import geon
 from geon.models import Coordinate, GeonPlace
 
-try:
-    import requests
-except ImportError:
+# requests (and requests-cache) are imported on first use — pulling in
+# urllib3 and friends is a sizeable share of start-up — so only check
+# here that the package is installed.
+if importlib.util.find_spec("requests") is None:
     print("This example requires the 'requests' package.")
     print("Install with:  pip install requests")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 OVERPASS_URL = "https://overpass-api.de/api/interpreter"
 
+# OSM tag keys consulted for each kind of GEON field.
+_TYPE_KEYS = frozenset({"building", "highway", "railway", "leisure",
+                        "amenity", "natural", "landuse", "tourism"})
+_PURPOSE_KEYS = ("amenity", "leisure", "shop", "tourism", "sport")
+_EXTRA_KEYS = ("opening_hours", "website", "phone", "cuisine", "operator")
+
+# Pulls (lat, lon) out of an Overpass geometry point in one C-level call.
+_LAT_LON = itemgetter("lat", "lon")
+
+# Tag key -> bitmask of the fields it feeds, so one pass over an element's
+# tags can route each tag everywhere it is used.
+_ROLE_TYPE, _ROLE_PURPOSE, _ROLE_EXTRA = 1, 2, 4
+_TAG_ROLES: dict[str, int] = {}
+for _role, _keys in ((_ROLE_TYPE, _TYPE_KEYS), (_ROLE_PURPOSE, _PURPOSE_KEYS),
+                     (_ROLE_EXTRA, _EXTRA_KEYS)):
+    for _key in _keys:
+        _TAG_ROLES[_key] = _TAG_ROLES.get(_key, 0) | _role
+
+
+_SESSION = None
+
+
+def _session():
+    """Return the shared HTTP session, creating it on first call.
+
+    One keep-alive session serves every query so they share TCP/TLS
+    connections; the pool is sized for the concurrent queries issued
+    below. When requests-cache is installed the session is a cached one:
+    Overpass answers are stable for a given query, so repeat runs are
+    served from disk instead of hitting the public API again.
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        try:
+            import requests_cache
+        except ImportError:
+            session = requests.Session()
+        else:
+            session = requests_cache.CachedSession(
+                os.path.join(os.path.dirname(os.path.abspath(__file__)), "overpass_cache"),
+                backend="sqlite",
+                expire_after=86400,
+            )
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        _SESSION = session
+    return _SESSION
+
 
 def overpass_query(query: str) -> dict:
     """Run an Overpass QL query and return the JSON response."""
-    resp = requests.get(OVERPASS_URL, params={"data": query}, timeout=30)
+    resp = _session().get(OVERPASS_URL, params={"data": query}, timeout=30)
     resp.raise_for_status()
+    if orjson is not None:
+        return orjson.loads(resp.content)  # parses the raw bytes, no decode
     return resp.json()
 
 
@@ -37,12 +98,23 @@ def osm_element_to_geon(element: dict, tags: dict | None = None) -> GeonPlace:
 
     p = GeonPlace()
     p.place = tags.get("name", tags.get("name:en", "Unnamed"))
-    p.id = f"osm:{element['type']}/{element['id']}"
+    type_id = f"{element['type']}/{element['id']}"
+    p.id = f"osm:{type_id}"
+
+    # Route tags to type inference, purpose and extra metadata in one pass
+    type_props = {}
+    for key, value in tags.items():
+        role = _TAG_ROLES.get(key)
+        if role is None:
+            continue
+        if role & _ROLE_TYPE:
+            type_props[key] = value
+        if role & _ROLE_PURPOSE:
+            p.purpose.append(f"{key}: {value}")
+        if role & _ROLE_EXTRA:
+            p.extra[key] = value
 
     # Infer type from OSM tags
-    type_props = {k: v for k, v in tags.items()
-                  if k in ("building", "highway", "railway", "leisure",
-                           "amenity", "natural", "landuse", "tourism")}
     inferred = geon.from_geojson({
         "type": "Feature",
         "geometry": {"type": "Point", "coordinates": [0, 0]},
@@ -57,35 +129,24 @@ def osm_element_to_geon(element: dict, tags: dict | None = None) -> GeonPlace:
         p.location = Coordinate(lat=element["center"]["lat"],
                                 lon=element["center"]["lon"])
     elif "bounds" in element:
-        b = element["bounds"]
-        p.location = Coordinate(
-            lat=(b["minlat"] + b["maxlat"]) / 2,
-            lon=(b["minlon"] + b["maxlon"]) / 2,
-        )
+        p.location = _bounds_centre(element["bounds"])
 
     # Boundary from way geometry
     if "geometry" in element:
-        p.boundary = [
-            Coordinate(lat=pt["lat"], lon=pt["lon"])
-            for pt in element["geometry"]
-        ]
-
-    # Purpose from amenity / leisure / shop tags
-    for key in ("amenity", "leisure", "shop", "tourism", "sport"):
-        if key in tags:
-            p.purpose.append(f"{key}: {tags[key]}")
+        p.boundary = Coordinate.from_array(map(_LAT_LON, element["geometry"]))
 
     # Source
-    p.source = [f"OpenStreetMap ({element['type']}/{element['id']})"]
-
-    # Extra OSM metadata
-    for key in ("opening_hours", "website", "phone", "cuisine", "operator"):
-        if key in tags:
-            p.extra[key] = tags[key]
+    p.source = [f"OpenStreetMap ({type_id})"]
 
     return p
 
 
+def _bounds_centre(b: dict) -> Coordinate:
+    """Centre of an Overpass ``bounds`` box."""
+    return Coordinate(lat=(b["minlat"] + b["maxlat"]) * 0.5,
+                      lon=(b["minlon"] + b["maxlon"]) * 0.5)
+
+
 def _guess_type(tags: dict) -> str:
     if "amenity" in tags:
         return "building"
@@ -96,9 +157,7 @@ def _guess_type(tags: dict) -> str:
     return "hybrid"
 
 
-# ── Example 1: Fetch a specific POI by name ──────────────────────────────
-
-print("=== Example 1: Fetch a POI from OSM (Nottingham Castle) ===\n")
+# ── Queries ───────────────────────────────────────────────────────────────
 
 query_poi = """
 [out:json][timeout:10];
@@ -106,8 +165,33 @@ node["name"="Nottingham Castle"]["tourism"](around:5000,52.9481,-1.1560);
 out body;
 """
 
+query_polygon = """
+[out:json][timeout:10];
+way["name"="Wollaton Park"]["leisure"="park"](around:10000,52.9481,-1.1560);
+out body geom;
+"""
+
+query_pubs = """
+[out:json][timeout:10];
+node["amenity"="pub"](around:500,52.9548,-1.1581);
+out body 5;
+"""
+
+# The three queries are independent, so send them all at once; each
+# example below then waits only for its own response. The session is
+# created up front so the worker threads don't race to build it.
+_session()
+_pool = ThreadPoolExecutor(max_workers=3)
+pending_poi = _pool.submit(overpass_query, query_poi)
+pending_polygon = _pool.submit(overpass_query, query_polygon)
+pending_pubs = _pool.submit(overpass_query, query_pubs)
+
+# ── Example 1: Fetch a specific POI by name ──────────────────────────────
+
+print("=== Example 1: Fetch a POI from OSM (Nottingham Castle) ===\n")
+
 try:
-    data = overpass_query(query_poi)
+    data = pending_poi.result()
     if data["elements"]:
         el = data["elements"][0]
         place = osm_element_to_geon(el)
@@ -120,7 +204,7 @@ try:
             print(f"  {issue}")
     else:
         print("No results found. Showing fallback example...\n")
-        raise requests.ConnectionError("No results")
+        raise LookupError("No results")
 except Exception as e:
     print(f"(Could not reach Overpass API: {e})")
     print("Showing offline example instead:\n")
@@ -138,21 +222,15 @@ except Exception as e:
 
 print("\n=== Example 2: Fetch a polygon from OSM (Wollaton Park) ===\n")
 
-query_polygon = """
-[out:json][timeout:10];
-way["name"="Wollaton Park"]["leisure"="park"](around:10000,52.9481,-1.1560);
-out body geom;
-"""
-
 try:
-    data = overpass_query(query_polygon)
+    data = pending_polygon.result()
     if data["elements"]:
         el = data["elements"][0]
         place = osm_element_to_geon(el)
         print(geon.generate(place))
     else:
         print("No results found. Showing fallback...\n")
-        raise requests.ConnectionError("No results")
+        raise LookupError("No results")
 except Exception as e:
     print(f"(Could not reach Overpass API: {e})")
     print("Showing offline polygon example instead:\n")
@@ -179,22 +257,19 @@ except Exception as e:
 
 print("\n=== Example 3: All pubs within 500m of Nottingham centre ===\n")
 
-query_pubs = """
-[out:json][timeout:10];
-node["amenity"="pub"](around:500,52.9548,-1.1581);
-out body 5;
-"""
-
 try:
-    data = overpass_query(query_pubs)
-    places = [osm_element_to_geon(el) for el in data["elements"]]
+    data = pending_pubs.result()
+    # Reuse the query pool (idle by now) to convert the elements.
+    places = list(_pool.map(osm_element_to_geon, data["elements"]))
     if places:
         for p in places:
             print(f"  {p.place} @ {p.location}")
         print(f"\nShowing first result as GEON:\n")
         print(geon.generate(places[0]))
     else:
-        raise requests.ConnectionError("No results")
+        raise LookupError("No results")
 except Exception as e:
     print(f"(Could not reach Overpass API: {e})")
     print("Skipping live query example.")
+
+_pool.shutdown()
@@ -6,13 +6,14 @@ Overture Maps places dataset via their API.
 
 Requirements:
     pip install requests
+    pip install numpy       (optional, vectorized polygon centroids)
     (or: pip install geon[overture])
 """
 
-import sys, os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
+import sys
 import json
+from operator import itemgetter
+
 import geon
 from geon.models import Coordinate, GeonPlace
 
@@ -23,6 +24,15 @@ except ImportError:
     print("Install with:  pip install requests")
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Longitude and latitude of a GeoJSON position.
+_LON = itemgetter(0)
+_LAT = itemgetter(1)
+
 
 # Overture Maps data can be accessed via their public GeoParquet files on S3,
 # or via third-party APIs. Here we demonstrate a pattern using a local
@@ -36,8 +46,33 @@ def overture_feature_to_geon(feature: dict) -> GeonPlace:
     Overture features have a richer property structure than vanilla GeoJSON,
     including categories, confidence scores, and source information.
     """
+    p = _overture_properties_to_geon(feature)
+    _set_overture_geometry(p, feature.get("geometry", {}))
+    return p
+
+
+def overture_features_to_geon_batch(features: list[dict]) -> list[GeonPlace]:
+    """Convert a list of Overture features to GEON in two passes.
+
+    Properties are converted first; then every Point takes its location
+    straight from its coordinate list, and polygons and other geometries
+    go through the per-feature path. The result is the same as calling
+    :func:`overture_feature_to_geon` on each feature.
+    """
+    places = [_overture_properties_to_geon(f) for f in features]
+    for p, f in zip(places, features):
+        geom = f.get("geometry", {})
+        if geom.get("type") == "Point":
+            lon, lat = geom["coordinates"][:2]
+            p.location = Coordinate(lat, lon)
+        else:
+            _set_overture_geometry(p, geom)
+    return places
+
+
+def _overture_properties_to_geon(feature: dict) -> GeonPlace:
+    """Build a GeonPlace from an Overture feature's non-geometry fields."""
     props = feature.get("properties", {})
-    geom = feature.get("geometry", {})
 
     p = GeonPlace()
 
@@ -62,17 +97,6 @@ def overture_feature_to_geon(feature: dict) -> GeonPlace:
     else:
         p.type = "hybrid"
 
-    # Location
-    if geom.get("type") == "Point":
-        coords = geom["coordinates"]
-        p.location = Coordinate(lat=coords[1], lon=coords[0])
-    elif geom.get("type") == "Polygon":
-        ring = geom["coordinates"][0]
-        avg_lon = sum(c[0] for c in ring) / len(ring)
-        avg_lat = sum(c[1] for c in ring) / len(ring)
-        p.location = Coordinate(lat=avg_lat, lon=avg_lon)
-        p.boundary = [Coordinate(lat=c[1], lon=c[0]) for c in ring]
-
     # Confidence
     conf = props.get("confidence", None)
     if conf is not None:
@@ -81,12 +105,10 @@ def overture_feature_to_geon(feature: dict) -> GeonPlace:
     # Sources
     sources = props.get("sources", [])
     if isinstance(sources, list):
-        for src in sources:
-            if isinstance(src, dict):
-                dataset = src.get("dataset", "unknown")
-                p.source.append(f"Overture Maps ({dataset})")
-            else:
-                p.source.append(str(src))
+        p.source.extend(
+            f"Overture Maps ({src.get('dataset', 'unknown')})" if isinstance(src, dict) else str(src)
+            for src in sources
+        )
     if not p.source:
         p.source.append("Overture Maps")
 
@@ -107,34 +129,61 @@ def overture_feature_to_geon(feature: dict) -> GeonPlace:
     return p
 
 
+def _set_overture_geometry(p: GeonPlace, geom: dict) -> None:
+    """Set location (and boundary, for polygons) from a GeoJSON geometry."""
+    if geom.get("type") == "Point":
+        coords = geom["coordinates"]
+        p.location = Coordinate(lat=coords[1], lon=coords[0])
+    elif geom.get("type") == "Polygon":
+        ring = geom["coordinates"][0]
+        if np is not None:
+            arr = np.asarray(ring, dtype=np.float64)[:, :2]
+            avg_lon, avg_lat = arr.mean(axis=0).tolist()
+            p.boundary = Coordinate.from_array(arr[:, ::-1])
+        else:
+            avg_lon = sum(map(_LON, ring)) / len(ring)
+            avg_lat = sum(map(_LAT, ring)) / len(ring)
+            p.boundary = Coordinate.from_ring(ring)
+        p.location = Coordinate(lat=avg_lat, lon=avg_lon)
+
+
+# Overture category substring -> GEON type. Order matters: when several
+# keys occur in one category, the one listed first wins.
+_OVERTURE_TYPES = {
+    "restaurant": "building",
+    "cafe": "building",
+    "bar": "building",
+    "hotel": "building",
+    "school": "building",
+    "hospital": "building",
+    "bank": "building",
+    "shop": "building",
+    "supermarket": "building",
+    "park": "public_space",
+    "garden": "public_space",
+    "playground": "public_space",
+    "sports_centre": "public_space",
+    "stadium": "public_space",
+    "train_station": "transport_hub",
+    "bus_station": "transport_hub",
+    "airport": "transport_hub",
+    "museum": "landmark",
+    "monument": "landmark",
+    "church": "landmark",
+    "cathedral": "landmark",
+    "castle": "landmark",
+}
+
 def _overture_category_to_type(category: str) -> str:
     """Map Overture category strings to GEON types."""
     cat_lower = category.lower()
-    mapping = {
-        "restaurant": "building",
-        "cafe": "building",
-        "bar": "building",
-        "hotel": "building",
-        "school": "building",
-        "hospital": "building",
-        "bank": "building",
-        "shop": "building",
-        "supermarket": "building",
-        "park": "public_space",
-        "garden": "public_space",
-        "playground": "public_space",
-        "sports_centre": "public_space",
-        "stadium": "public_space",
-        "train_station": "transport_hub",
-        "bus_station": "transport_hub",
-        "airport": "transport_hub",
-        "museum": "landmark",
-        "monument": "landmark",
-        "church": "landmark",
-        "cathedral": "landmark",
-        "castle": "landmark",
-    }
-    for key, val in mapping.items():
+    # Most categories are exactly a table key. No key occurs inside a
+    # later-listed key of a different type, so an exact hit agrees with the
+    # ordered scan below.
+    exact = _OVERTURE_TYPES.get(cat_lower)
+    if exact is not None:
+        return exact
+    for key, val in _OVERTURE_TYPES.items():
         if key in cat_lower:
             return val
     return "hybrid"
@@ -235,7 +284,7 @@ overture_collection = {
     ],
 }
 
-places = [overture_feature_to_geon(f) for f in overture_collection["features"]]
+places = overture_features_to_geon_batch(overture_collection["features"])
 
 for p in places:
     print(f"--- {p.place} ({p.type}) ---")
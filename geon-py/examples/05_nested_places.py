@@ -4,9 +4,6 @@ Shows how to model a building that CONTAINS sub-places.
 No external dependencies required.
 """
 
-import sys, os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
 import geon
 
 # ── Build a nested place hierarchy ────────────────────────────────────────
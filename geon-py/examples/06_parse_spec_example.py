@@ -6,9 +6,7 @@ extended domain fields (BUILT_FORM, INFRASTRUCTURE, DEMOGRAPHICS, ECONOMY).
 No external dependencies required.
 """
 
-import sys, os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
+import functools
 import json
 import geon
 
@@ -127,7 +125,17 @@ UPDATED: 2025-01-20T09:00:00Z
 
 # ── Parse ─────────────────────────────────────────────────────────────────
 
-place = geon.parse(APPENDIX_A)
+@functools.lru_cache(maxsize=128)
+def _parse_cached(text: str) -> geon.GeonPlace:
+    """geon.parse, memoized on the input text.
+
+    Repeated calls with the same text return the *same* GeonPlace, so
+    callers must not mutate it; copy.deepcopy() it first if you need to.
+    """
+    return geon.parse(text)
+
+
+place = _parse_cached(APPENDIX_A)
 
 print("=== Parsed Appendix A ===")
 print(f"Place:       {place.place}")
@@ -165,7 +173,7 @@ print()
 
 # ── Convert to GeoJSON ───────────────────────────────────────────────────
 
-geojson_str = geon.to_geojson_string(place, indent=2)
+geojson_str = geon.to_geojson_string(place, indent=2, fast=True)
 print("=== GeoJSON output (truncated) ===")
 lines = geojson_str.split("\n")
 for line in lines[:30]:
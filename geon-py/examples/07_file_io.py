@@ -2,13 +2,35 @@
 
 Demonstrates loading GEON from disk, modifying, and saving back.
 No external dependencies required.
-"""
 
-import sys, os, tempfile
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+By default the round-trip goes through in-memory buffers so the example
+leaves nothing behind; pass ``--disk`` to write real files under a
+temporary directory that is removed at the end.
+"""
 
+import io, os, sys, tempfile
 import geon
 
+USE_DISK = "--disk" in sys.argv
+workdir = tempfile.TemporaryDirectory() if USE_DISK else None
+
+
+def save(text: str, name: str):
+    """Write *text* to an in-memory buffer, or with ``--disk`` to *name* in ``workdir``.
+
+    Returns the buffer, or the path of the written file.
+    """
+    if not USE_DISK:
+        return io.StringIO(text)
+    path = os.path.join(workdir.name, name)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return path
+
+
+def describe(saved) -> str:
+    return saved if USE_DISK else "<in-memory buffer>"
+
 # ── Create a sample .geon file ────────────────────────────────────────────
 
 place = geon.GeonPlace(
@@ -29,19 +51,19 @@ place = geon.GeonPlace(
     source=["OpenStreetMap (2025-01)"],
 )
 
-# Write to a temp file
-tmp = tempfile.NamedTemporaryFile(suffix=".geon", mode="w", delete=False, encoding="utf-8")
+# Write it out
 text = geon.generate(place)
-tmp.write(text)
-tmp.close()
+tmp = save(text, "victoria_park.geon")
 
-print(f"Wrote GEON file: {tmp.name}")
+print(f"Wrote GEON file: {describe(tmp)}")
 print(f"Size: {len(text)} bytes\n")
 
 # ── Read it back ──────────────────────────────────────────────────────────
 
-with open(tmp.name, encoding="utf-8") as f:
-    loaded = geon.parse(f.read())
+if USE_DISK:
+    loaded = geon.parse_file(tmp)
+else:
+    loaded = geon.parse(tmp.getvalue())
 
 print(f"Loaded: {loaded.place}")
 print(f"Type:   {loaded.type}")
@@ -60,15 +82,13 @@ loaded.adjacencies = [
 ]
 
 updated_text = geon.generate(loaded)
-tmp2 = tempfile.NamedTemporaryFile(suffix=".geon", mode="w", delete=False, encoding="utf-8")
-tmp2.write(updated_text)
-tmp2.close()
+tmp2 = save(updated_text, "victoria_park_updated.geon")
 
-print(f"Updated GEON file: {tmp2.name}")
+print(f"Updated GEON file: {describe(tmp2)}")
 print(f"Size: {len(updated_text)} bytes\n")
 print("=== Updated content ===")
 print(updated_text)
 
 # Clean up
-os.unlink(tmp.name)
-os.unlink(tmp2.name)
+if USE_DISK:
+    workdir.cleanup()
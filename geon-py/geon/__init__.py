@@ -27,15 +27,18 @@ __version__ = "0.1.0"
 
 from .converter import (
     from_geojson,
+    from_geojson_stream,
     from_geojson_string,
+    from_geojson_vectorized,
     to_geojson,
     to_geojson_collection,
     to_geojson_string,
+    to_ndgeojson,
 )
-from .generator import generate
+from .generator import generate, generate_to
 from .models import Coordinate, Extent, GeonPlace
-from .parser import parse, parse_many
-from .validator import Issue, Severity, ValidationResult, validate
+from .parser import parse, parse_file, parse_many
+from .validator import Issue, IssueList, Severity, ValidationResult, validate
 from .vocab import (
     ALL_PURPOSES,
     EXPERIENCE_SCALES,
@@ -50,18 +53,24 @@ __all__ = [
     "Extent",
     # Parse / generate
     "parse",
+    "parse_file",
     "parse_many",
     "generate",
+    "generate_to",
     # Conversion
     "from_geojson",
     "from_geojson_string",
+    "from_geojson_stream",
+    "from_geojson_vectorized",
     "to_geojson",
     "to_geojson_collection",
     "to_geojson_string",
+    "to_ndgeojson",
     # Validation
     "validate",
     "ValidationResult",
     "Issue",
+    "IssueList",
     "Severity",
     # Vocabularies
     "PLACE_TYPES",
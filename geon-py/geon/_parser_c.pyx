@@ -0,0 +1,204 @@
+# cython: language_level=3, boundscheck=False
+"""Compiled versions of the parser's tokenizer and block builder.
+
+This mirrors ``_tokenize_lines`` and ``_build`` in :mod:`geon.parser`
+line for line, with C-typed indices and indents; keep the two in step.
+:mod:`geon.parser` imports these when the extension has been built and
+falls back to its pure-Python versions otherwise.
+"""
+
+from array import array
+
+# Frame kinds and sinks — same meaning as in parser.py.
+cdef enum:
+    _BLOCK = 0
+    _CHILDREN = 1
+
+cdef enum:
+    _TO_KEY = 0
+    _APPEND = 1
+    _ATTACH = 2
+
+
+cdef object _split_key_value(str line):
+    """Split ``KEY: value`` — returns None when there is no colon."""
+    cdef str key, sep, value
+    key, sep, value = line.strip().partition(":")
+    if not sep:
+        return None
+    return key.rstrip(), value.lstrip()
+
+
+def _tokenize_lines(text):
+    """Return parallel (indents, contents) for the non-blank lines."""
+    if isinstance(text, str):
+        text = text.splitlines()
+    indents = array("i")
+    cdef list contents = []
+    cdef str raw, body, content
+    for raw in text:
+        body = raw.lstrip(" ")
+        content = body.strip()
+        if content:
+            indents.append(len(raw) - len(body))
+            contents.append(content)
+    return indents, contents
+
+
+cdef class _Frame:
+    cdef int kind, indent, offset, sink
+    cdef Py_ssize_t i, hi
+    cdef dict result
+    cdef list items
+    cdef bint is_list
+    cdef object target
+    cdef str key
+
+    def __cinit__(self, int kind, Py_ssize_t i, Py_ssize_t hi, int indent, int offset,
+                  int sink=_TO_KEY, object target=None, str key=""):
+        self.kind = kind
+        self.i = i
+        self.hi = hi
+        self.indent = indent
+        self.offset = offset
+        self.result = {}
+        self.items = []
+        self.is_list = False
+        self.sink = sink
+        self.target = target
+        self.key = key
+
+
+def _build(indents, list contents, Py_ssize_t start=0, end=None):
+    """Build the raw dict/list tree for lines ``start:end`` of a tokenized text."""
+    cdef const int[:] ind = indents
+    cdef Py_ssize_t hi_root = len(contents) if end is None else end
+    cdef _Frame root = _Frame(_BLOCK, start, hi_root, 0, 0)
+    cdef list stack = [root]
+    cdef _Frame f, child, parent
+    cdef Py_ssize_t i, j, hi
+    cdef int offset, indent_at, indent, field_offset
+    cdef str content, item_text
+    cdef dict result, mapping
+    cdef list items
+    cdef object kv, value, last, kv2
+
+    while stack:
+        f = <_Frame>stack[-1]
+        child = None
+        i, hi, offset, indent_at = f.i, f.hi, f.offset, f.indent
+
+        if f.kind == _BLOCK:
+            result = f.result
+            while i < hi:
+                indent = ind[i] - offset
+                content = <str>contents[i]
+                if indent < indent_at:
+                    break
+                if indent > indent_at:
+                    i += 1
+                    continue
+                kv = _split_key_value(content)
+                if kv is None:
+                    i += 1
+                    continue
+                key, value = kv
+                if value:
+                    result[key] = value
+                    i += 1
+                else:
+                    child = _Frame(_CHILDREN, i + 1, hi, indent_at + 2, offset,
+                                   _TO_KEY, f, key)
+                    break
+        else:
+            items = f.items
+            mapping = f.result
+            while i < hi:
+                indent = ind[i] - offset
+                content = <str>contents[i]
+                if indent < indent_at:
+                    break
+
+                if indent == indent_at:
+                    if content.startswith("- "):
+                        f.is_list = True
+                        item_text = content[2:].strip()
+
+                        kv = _split_key_value(item_text)
+                        if kv is not None and kv[0] == "PLACE":
+                            j = i + 1
+                            while j < hi and ind[j] - offset > indent_at:
+                                j += 1
+                            if j > i + 1:
+                                field_offset = ind[i + 1]
+                            else:
+                                field_offset = offset + indent_at + 2
+                            child = _Frame(_BLOCK, i + 1, j, 0, field_offset,
+                                           _APPEND, items)
+                            if kv[1]:
+                                child.result["PLACE"] = kv[1]
+                            else:
+                                stack.append(child)
+                                child = _Frame(_CHILDREN, i + 1, j, 2, field_offset,
+                                               _TO_KEY, child, "PLACE")
+                            i = j
+                            break
+                        items.append(item_text)
+                        i += 1
+                    else:
+                        kv = _split_key_value(content)
+                        if kv is not None:
+                            key, value = kv
+                            if value:
+                                mapping[key] = value
+                                i += 1
+                            else:
+                                child = _Frame(_CHILDREN, i + 1, hi, indent_at + 2,
+                                               offset, _TO_KEY, f, key)
+                                break
+                        else:
+                            i += 1
+                elif f.is_list and items:
+                    j = i
+                    while j < hi and ind[j] - offset > indent_at:
+                        j += 1
+                    child = _Frame(_BLOCK, i, j, indent, offset, _ATTACH, items)
+                    i = j
+                    break
+                else:
+                    i += 1
+
+        f.i = i
+        if child is not None:
+            stack.append(child)
+            continue
+
+        stack.pop()
+        if f.kind == _BLOCK:
+            value = f.result
+        elif f.is_list or not f.result:
+            value = f.items
+        else:
+            value = f.result
+
+        if f.sink == _TO_KEY:
+            if f.target is None:
+                return value
+            parent = <_Frame>f.target
+            parent.result[f.key] = value
+            parent.i = i
+        elif f.sink == _APPEND:
+            (<list>f.target).append(value)
+        else:
+            items = <list>f.target
+            last = items[-1]
+            if isinstance(last, str):
+                kv2 = _split_key_value(last)
+                if kv2 is not None:
+                    items[-1] = {kv2[0]: kv2[1], **value}
+                else:
+                    items[-1] = {"_value": last, **value}
+            elif isinstance(last, dict):
+                last.update(value)
+
+    return root.result
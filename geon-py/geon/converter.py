@@ -3,10 +3,19 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+import os
+from collections.abc import Iterable, Iterator
+from itertools import chain
+from operator import itemgetter
+from typing import IO, Any
 
 from .models import Coordinate, GeonPlace
 
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install geon[speedups]
+    orjson = None
+
 
 # ---------------------------------------------------------------------------
 # GeoJSON → GEON
@@ -68,70 +77,192 @@ _TYPE_MAPPING: dict[str, str] = {
 }
 
 
+# The GEON types _TYPE_MAPPING produces, keyed by themselves: an explicit
+# geon_type naming one of them resolves to the shared constant rather than
+# a fresh string per feature. A fixed table, so unlike sys.intern it cannot
+# grow with the input.
+_SHARED_TYPES: dict[str, str] = {t: t for t in (*_TYPE_MAPPING.values(), "hybrid")}
+
+# Property keys consulted by _infer_type, in priority order.
+_TYPE_KEYS: tuple[str, ...] = (
+    "type", "building", "highway", "railway", "leisure", "amenity",
+    "natural", "landuse", "tourism", "man_made", "waterway",
+)
+
+
 def _infer_type(properties: dict[str, Any]) -> str:
     """Best-effort type inference from GeoJSON properties."""
     # Check explicit type/geon_type
     if "geon_type" in properties:
-        return str(properties["geon_type"])
-
-    # Check common OSM-style keys
-    for key in ("type", "building", "highway", "railway", "leisure", "amenity",
-                "natural", "landuse", "tourism", "man_made", "waterway"):
-        val = properties.get(key, "")
-        if val and str(val) in _TYPE_MAPPING:
-            return _TYPE_MAPPING[str(val)]
+        geon_type = str(properties["geon_type"])
+        return _SHARED_TYPES.get(geon_type, geon_type)
+
+    # Check common OSM-style keys: one probe into _TYPE_MAPPING per key,
+    # converting only values that aren't already strings.
+    for key in _TYPE_KEYS:
+        val = properties.get(key)
+        if val:
+            geon_type = _TYPE_MAPPING.get(val if val.__class__ is str else str(val))
+            if geon_type is not None:
+                return geon_type
 
     return "hybrid"
 
 
+# Property keys consulted by _infer_name, in priority order.
+_NAME_KEYS: tuple[str, ...] = (
+    "name", "name:en", "official_name", "alt_name", "title", "label",
+)
+
+
 def _infer_name(properties: dict[str, Any]) -> str:
-    for key in ("name", "name:en", "official_name", "alt_name", "title", "label"):
-        if key in properties and properties[key]:
-            return str(properties[key])
+    for key in _NAME_KEYS:
+        if key in properties:
+            val = properties[key]
+            if val:
+                return val if val.__class__ is str else str(val)
     return "Unnamed"
 
 
-def _extract_centroid(geometry: dict[str, Any]) -> Coordinate | None:
-    """Extract a representative point from GeoJSON geometry."""
-    gtype = geometry.get("type", "")
-    coords = geometry.get("coordinates")
-    if not coords:
-        return None
+# Longitude and latitude of a GeoJSON position.
+_LON = itemgetter(0)
+_LAT = itemgetter(1)
 
-    if gtype == "Point":
-        return Coordinate.from_geojson_position(coords)
+# A ring whose signed area is this small a fraction of the summed edge
+# terms has cancelled out to (numerically) nothing: treat it as having no
+# area and use the vertex average.
+_MIN_AREA_RATIO = 1e-9
 
-    if gtype in ("MultiPoint", "LineString"):
-        # Use midpoint of the coordinate list
-        mid = coords[len(coords) // 2]
-        return Coordinate.from_geojson_position(mid)
+# Centroids are rounded to this many decimal places (about 0.1 mm), well
+# below the precision of any input, so the rounding error of the shoelace
+# sums does not show up as trailing digits (52.477700000000006) in GEON text.
+_CENTROID_DIGITS = 9
 
-    if gtype == "Polygon":
-        # Centroid of the exterior ring (simple average)
-        ring = coords[0]
-        avg_lon = sum(c[0] for c in ring) / len(ring)
-        avg_lat = sum(c[1] for c in ring) / len(ring)
-        return Coordinate(lat=avg_lat, lon=avg_lon)
 
-    if gtype == "MultiPolygon":
-        # Centroid of the first polygon
-        ring = coords[0][0]
-        avg_lon = sum(c[0] for c in ring) / len(ring)
-        avg_lat = sum(c[1] for c in ring) / len(ring)
-        return Coordinate(lat=avg_lat, lon=avg_lon)
+def _centroid(lat: float, lon: float) -> Coordinate:
+    return Coordinate(round(lat, _CENTROID_DIGITS), round(lon, _CENTROID_DIGITS))
+
+
+def _ring_geometry(ring: Any) -> tuple[Coordinate, list[Coordinate]]:
+    """Return the area-weighted centroid and boundary of *ring*.
 
+    *ring* is a sequence of [lon, lat] positions. The centroid uses the
+    shoelace formula with the first vertex as origin: that keeps the cross
+    products small (no cancellation between large absolute coordinates)
+    and makes the closing edge back to the first vertex contribute
+    nothing, so open and closed rings give the same result. Degenerate
+    rings with no area, such as collinear points, fall back to the vertex
+    average. Either way the centroid is rounded to :data:`_CENTROID_DIGITS`
+    decimal places.
+
+    The positions are walked once, building the boundary while the
+    centroid sums accumulate.
+    """
+    boundary = []
+    add = boundary.append
+    x0, y0 = ring[0][0], ring[0][1]
+    px = py = 0.0
+    area2 = abs_area2 = cx = cy = 0.0
+    for c in ring:
+        lon, lat = c[0], c[1]
+        add(Coordinate(lat, lon))
+        x = lon - x0
+        y = lat - y0
+        f = px * y - x * py
+        area2 += f
+        abs_area2 += abs(f)
+        cx += (px + x) * f
+        cy += (py + y) * f
+        px, py = x, y
+    if abs(area2) > _MIN_AREA_RATIO * abs_area2:
+        centroid = _centroid(y0 + cy / (3 * area2), x0 + cx / (3 * area2))
+    else:
+        avg_lon = sum(map(_LON, ring)) / len(ring)
+        avg_lat = sum(map(_LAT, ring)) / len(ring)
+        centroid = _centroid(avg_lat, avg_lon)
+    return centroid, boundary
+
+
+def _rings_geometry(rings: list[list[Any]]) -> list[tuple[Coordinate, list[Coordinate]]]:
+    """Return ``_ring_geometry(ring)`` for every ring, computed in one batch.
+
+    The rings (non-empty lists of [lon, lat] positions) are flattened into
+    a single ``(N, 2)`` array with each ring's start offset kept alongside,
+    so the shoelace sums for all rings are a handful of ``np.add.reduceat``
+    calls. Centroids match :func:`_ring_geometry` up to floating-point
+    rounding; boundaries are built from the original positions.
+    """
+    import numpy as np
+
+    lens = np.fromiter(map(len, rings), np.intp, count=len(rings))
+    total = int(lens.sum())
+    flat = np.fromiter(chain.from_iterable(chain.from_iterable(rings)), np.float64)
+    if flat.size == 2 * total:
+        xy = flat.reshape(total, 2)
+    else:
+        # Some positions carry an elevation: keep [lon, lat] only.
+        xy = np.array([c[:2] for ring in rings for c in ring], dtype=np.float64)
+    starts = np.zeros(len(rings), np.intp)
+    np.cumsum(lens[:-1], out=starts[1:])
+
+    origin = xy[starts]
+    rel = xy - np.repeat(origin, lens, axis=0)
+    x, y = rel[:, 0], rel[:, 1]
+    nx, ny = np.roll(x, -1), np.roll(y, -1)
+    # Edge i runs from vertex i to i + 1; the edge leaving a ring's last
+    # vertex would reach into the next ring, so it contributes nothing.
+    f = x * ny - nx * y
+    f[starts + lens - 1] = 0.0
+    area2 = np.add.reduceat(f, starts)
+    abs_area2 = np.add.reduceat(np.abs(f), starts)
+    cx = np.add.reduceat((x + nx) * f, starts)
+    cy = np.add.reduceat((y + ny) * f, starts)
+
+    has_area = np.abs(area2) > _MIN_AREA_RATIO * abs_area2
+    mean = np.add.reduceat(xy, starts, axis=0) / lens[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lon = np.where(has_area, origin[:, 0] + cx / (3 * area2), mean[:, 0])
+        lat = np.where(has_area, origin[:, 1] + cy / (3 * area2), mean[:, 1])
+
+    from_ring = Coordinate.from_ring
+    return [
+        (_centroid(c_lat, c_lon), from_ring(ring))
+        for ring, c_lat, c_lon in zip(rings, lat.tolist(), lon.tolist())
+    ]
+
+
+def _exterior_ring(gtype: str, coords: Any) -> Any:
+    """Return the ring used for a polygon's boundary, or None for other types."""
+    if gtype == "Polygon":
+        return coords[0]
+    if gtype == "MultiPolygon":
+        return coords[0][0]
     return None
 
 
-def _extract_boundary(geometry: dict[str, Any]) -> list[Coordinate]:
-    """Extract boundary coordinates from a Polygon geometry."""
+def _extract_geometry(geometry: dict[str, Any]) -> tuple[Coordinate | None, list[Coordinate]]:
+    """Extract a representative point and boundary from GeoJSON geometry.
+
+    Polygons get their exterior ring as the boundary, MultiPolygons that
+    of their first polygon; other geometry types have no boundary.
+    """
     gtype = geometry.get("type", "")
     coords = geometry.get("coordinates")
-    if gtype == "Polygon" and coords:
-        return [Coordinate.from_geojson_position(c) for c in coords[0]]
-    if gtype == "MultiPolygon" and coords:
-        return [Coordinate.from_geojson_position(c) for c in coords[0][0]]
-    return []
+    if not coords:
+        return None, []
+
+    if gtype == "Point":
+        return Coordinate.from_geojson_position(coords), []
+
+    if gtype in ("MultiPoint", "LineString"):
+        # Use midpoint of the coordinate list
+        mid = coords[len(coords) // 2]
+        return Coordinate.from_geojson_position(mid), []
+
+    ring = _exterior_ring(gtype, coords)
+    if ring is None or not len(ring):
+        return None, []
+    return _ring_geometry(ring)
 
 
 def _extract_purposes(properties: dict[str, Any]) -> list[str]:
@@ -155,16 +286,34 @@ def _extract_purposes(properties: dict[str, Any]) -> list[str]:
     return purposes
 
 
-def from_geojson(geojson: dict[str, Any]) -> GeonPlace | list[GeonPlace]:
+# Below this many features, from_geojson(parallel=True) stays in-process:
+# pickling features out and places back costs more than it saves.
+PARALLEL_MIN_FEATURES = 256
+
+
+def from_geojson(geojson: dict[str, Any], parallel: bool = False,
+                 max_workers: int | None = None) -> GeonPlace | list[GeonPlace]:
     """Convert a GeoJSON Feature or FeatureCollection to GEON.
 
     Returns a single :class:`GeonPlace` for a Feature, or a list for a
-    FeatureCollection.
+    FeatureCollection. With ``parallel=True`` and at least
+    :data:`PARALLEL_MIN_FEATURES` features, a collection is converted
+    across a process pool of *max_workers* processes (default: one per
+    CPU); the result is the same list, in the same order.
     """
     gtype = geojson.get("type", "")
 
     if gtype == "FeatureCollection":
-        return [_feature_to_geon(f) for f in geojson.get("features", [])]
+        features = geojson.get("features", [])
+        if not parallel or len(features) < PARALLEL_MIN_FEATURES:
+            return [_feature_to_geon(f) for f in features]
+        # Imported here: concurrent.futures is only needed on this path.
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(workers) as pool:
+            return list(pool.map(_feature_to_geon, features,
+                                 chunksize=max(1, len(features) // (workers * 4))))
 
     if gtype == "Feature":
         return _feature_to_geon(geojson)
@@ -172,15 +321,23 @@ def from_geojson(geojson: dict[str, Any]) -> GeonPlace | list[GeonPlace]:
     raise ValueError(f"Unsupported GeoJSON type: {gtype}")
 
 
+# SOURCE entry appended to every place converted from GeoJSON.
+_GEOJSON_SOURCE = "GeoJSON conversion"
+
+
 def _feature_to_geon(feature: dict[str, Any]) -> GeonPlace:
+    p = _feature_properties_to_geon(feature)
+    p.location, p.boundary = _extract_geometry(feature.get("geometry", {}) or {})
+    return p
+
+
+def _feature_properties_to_geon(feature: dict[str, Any]) -> GeonPlace:
+    """Convert everything about *feature* except its geometry."""
     props = feature.get("properties", {}) or {}
-    geom = feature.get("geometry", {}) or {}
 
     p = GeonPlace()
     p.place = _infer_name(props)
     p.type = _infer_type(props)
-    p.location = _extract_centroid(geom)
-    p.boundary = _extract_boundary(geom)
     p.purpose = _extract_purposes(props)
 
     # Carry over experience if present
@@ -192,19 +349,100 @@ def _feature_to_geon(feature: dict[str, Any]) -> GeonPlace:
     if feat_id:
         p.id = str(feat_id)
 
-    # Carry over source
+    # Carry over source, recording the conversion. A source list is copied
+    # rather than extended in place, so the input feature is left as it was.
     if "source" in props:
         val = props["source"]
-        p.source = val if isinstance(val, list) else [str(val)]
-
-    p.source.append("GeoJSON conversion")
+        if isinstance(val, list):
+            p.source = [*val, _GEOJSON_SOURCE]
+        else:
+            p.source = [str(val), _GEOJSON_SOURCE]
+    else:
+        p.source.append(_GEOJSON_SOURCE)
 
     return p
 
 
-def from_geojson_string(text: str) -> GeonPlace | list[GeonPlace]:
-    """Parse a GeoJSON string and convert to GEON."""
-    return from_geojson(json.loads(text))
+def _loads(text: str | bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (no NaN/Infinity, 64-bit integers only);
+            # let the standard library accept or reject what it refuses.
+            pass
+    return json.loads(text)
+
+
+def from_geojson_string(text: str | bytes) -> GeonPlace | list[GeonPlace]:
+    """Parse a GeoJSON string and convert to GEON.
+
+    The document is decoded with orjson when it is installed, falling
+    back to the standard library for input orjson does not accept.
+    """
+    return from_geojson(_loads(text))
+
+
+def from_geojson_stream(fp: IO[bytes] | IO[str]) -> Iterator[GeonPlace]:
+    """Convert the features of a GeoJSON FeatureCollection file one at a time.
+
+    *fp* is an open file (binary mode is fastest). With ijson installed
+    (``pip install geon[stream]``) features are decoded incrementally and
+    yielded as they are converted, so memory use is bounded by the largest
+    single feature rather than the whole document. Without it the file is
+    read and decoded in one go, and the same places are yielded.
+    """
+    # Imported here rather than at module load: only this function uses it.
+    try:
+        import ijson
+    except ImportError:
+        features = _loads(fp.read()).get("features", [])
+    else:
+        features = ijson.items(fp, "features.item", use_float=True)
+    return (_feature_to_geon(f) for f in features)
+
+
+def from_geojson_vectorized(geojson: dict[str, Any]) -> list[GeonPlace]:
+    """Convert a FeatureCollection like :func:`from_geojson`, batching polygon geometry.
+
+    The exterior rings of all Polygon and MultiPolygon features are laid
+    out in one NumPy array and their centroids computed together, which
+    pays off for coordinate-heavy collections such as building
+    footprints. The places are the same as :func:`from_geojson` returns,
+    with centroids equal up to floating-point rounding. Requires NumPy
+    (``pip install geon[numpy]``).
+    """
+    # Imported here rather than at module load: numpy more than doubles
+    # the time to import geon, and only this function needs it.
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "from_geojson_vectorized requires numpy: pip install geon[numpy]"
+        ) from None
+    gtype = geojson.get("type", "")
+    if gtype != "FeatureCollection":
+        raise ValueError(f"Expected a GeoJSON FeatureCollection, got: {gtype}")
+
+    places = []
+    rings = []
+    ring_places = []
+    for feature in geojson.get("features", []):
+        p = _feature_properties_to_geon(feature)
+        geom = feature.get("geometry", {}) or {}
+        coords = geom.get("coordinates")
+        ring = _exterior_ring(geom.get("type", ""), coords) if coords else None
+        if ring.__class__ is list and ring:
+            rings.append(ring)
+            ring_places.append(p)
+        else:
+            p.location, p.boundary = _extract_geometry(geom)
+        places.append(p)
+
+    if rings:
+        for p, (location, boundary) in zip(ring_places, _rings_geometry(rings)):
+            p.location, p.boundary = location, boundary
+    return places
 
 
 # ---------------------------------------------------------------------------
@@ -261,12 +499,14 @@ def to_geojson(place: GeonPlace) -> dict[str, Any]:
     if place.boundary and len(place.boundary) >= 3:
         geometry = {
             "type": "Polygon",
-            "coordinates": [[c.to_geojson_position() for c in place.boundary]],
+            # Same as c.to_geojson_position(), without a call per vertex.
+            "coordinates": [[[c.lon, c.lat] for c in place.boundary]],
         }
     elif place.location:
+        location = place.location
         geometry = {
             "type": "Point",
-            "coordinates": place.location.to_geojson_position(),
+            "coordinates": [location.lon, location.lat],
         }
     else:
         geometry = {"type": "Point", "coordinates": [0, 0]}
@@ -291,8 +531,41 @@ def to_geojson_collection(places: list[GeonPlace]) -> dict[str, Any]:
     }
 
 
-def to_geojson_string(place: GeonPlace | list[GeonPlace], indent: int = 2) -> str:
-    """Serialize GEON to a GeoJSON string."""
+def _dumps(obj: Any, indent: int | None, fast: bool) -> str:
+    if fast and orjson is not None and indent in (None, 2):
+        option = orjson.OPT_INDENT_2 if indent == 2 else 0
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=indent)
+
+
+def to_geojson_string(
+    place: GeonPlace | list[GeonPlace],
+    indent: int | None = 2,
+    fast: bool = False,
+) -> str:
+    """Serialize GEON to a GeoJSON string.
+
+    With ``fast=True`` the document is encoded by orjson when it is
+    installed.  orjson writes non-ASCII text as UTF-8 rather than ``\\u``
+    escapes, spells some floats differently (``0.00001`` not ``1e-05``)
+    and, for ``indent=None``, omits the space after separators.  Indents
+    other than 2 or None always use the standard library.
+    """
     if isinstance(place, list):
-        return json.dumps(to_geojson_collection(place), indent=indent)
-    return json.dumps(to_geojson(place), indent=indent)
+        return _dumps(to_geojson_collection(place), indent, fast)
+    return _dumps(to_geojson(place), indent, fast)
+
+
+def to_ndgeojson(places: Iterable[GeonPlace], out: Any, fast: bool = False) -> None:
+    """Write *places* to *out* as newline-delimited GeoJSON, one Feature per line.
+
+    *out* is any object with ``write(str)``. Each feature is encoded and
+    written as soon as it is converted, so neither the collection nor the
+    output document is held in memory; *places* may itself be a generator
+    such as :func:`from_geojson_stream`. ``fast=True`` encodes with orjson
+    when it is installed, as in :func:`to_geojson_string`.
+    """
+    write = out.write
+    for p in places:
+        write(_dumps(to_geojson(p), None, fast))
+        write("\n")
@@ -2,208 +2,257 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
 from typing import Any
 
 from .models import Coordinate, GeonPlace
 
 # ---------------------------------------------------------------------------
 # Helpers
+#
+# Each helper takes an ``emit`` callable (typically ``parts.append``) and
+# writes its fragments through it; generate() joins them once at the end.
+# Values are formatted by the emitting f-string itself, so callers pass
+# coordinates, extents etc. as-is rather than str()-ing them first.
 # ---------------------------------------------------------------------------
 
 _INDENT = "  "
 
 
-def _line(key: str, value: str, depth: int = 0) -> str:
-    prefix = _INDENT * depth
-    return f"{prefix}{key}: {value}\n"
+class _PrefixCache(dict):
+    """depth -> indent string, built on first use and reused for every line."""
 
+    def __missing__(self, depth: int) -> str:
+        prefix = self[depth] = _INDENT * depth
+        return prefix
 
-def _section_header(key: str, depth: int = 0) -> str:
-    prefix = _INDENT * depth
-    return f"{prefix}{key}:\n"
 
+_PREFIX = _PrefixCache()
 
-def _list_items(items: list[str], depth: int = 1) -> str:
-    prefix = _INDENT * depth
-    return "".join(f"{prefix}- {item}\n" for item in items)
+# Extended / extension dict sections, in output order: (GEON key, attribute).
+_EXTENDED_FIELDS: tuple[tuple[str, str], ...] = (
+    ("BUILT_FORM", "built_form"),
+    ("ECOLOGY", "ecology"),
+    ("INFRASTRUCTURE", "infrastructure"),
+    ("DEMOGRAPHICS", "demographics"),
+    ("ECONOMY", "economy"),
+    ("VISUAL", "visual"),
+    ("VERTICAL_PROFILE", "vertical_profile"),
+)
 
+_Emit = Callable[[str], Any]
 
-def _dict_items(mapping: dict[str, Any], depth: int = 1) -> str:
+
+def _line(emit: _Emit, key: str, value: Any, depth: int = 0) -> None:
+    prefix = _PREFIX[depth]
+    emit(f"{prefix}{key}: {value}\n")
+
+
+def _section_header(emit: _Emit, key: str, depth: int = 0) -> None:
+    prefix = _PREFIX[depth]
+    emit(f"{prefix}{key}:\n")
+
+
+def _list_items(emit: _Emit, items: Iterable[Any], depth: int = 1) -> None:
+    prefix = _PREFIX[depth]
+    for item in items:
+        emit(f"{prefix}- {item}\n")
+
+
+def _coordinate_items(emit: _Emit, coords: Iterable[Coordinate], depth: int = 1) -> None:
+    """Like _list_items for coordinates, formatting lat/lon without __str__."""
+    prefix = _PREFIX[depth]
+    for c in coords:
+        emit(f"{prefix}- {c.lat}, {c.lon}\n")
+
+
+def _dict_items(emit: _Emit, mapping: dict[str, Any], depth: int = 1) -> None:
     """Render a dict of key: value pairs, recursing for nested dicts/lists."""
-    buf = ""
-    prefix = _INDENT * depth
+    prefix = _PREFIX[depth]
+    item_prefix = _PREFIX[depth + 1]
+    sub_prefix = _PREFIX[depth + 2]
     for k, v in mapping.items():
         if isinstance(v, dict):
-            buf += f"{prefix}{k}:\n"
-            buf += _dict_items(v, depth + 1)
+            emit(f"{prefix}{k}:\n")
+            _dict_items(emit, v, depth + 1)
         elif isinstance(v, list):
-            buf += f"{prefix}{k}:\n"
+            emit(f"{prefix}{k}:\n")
             for item in v:
                 if isinstance(item, dict):
                     # first key-value on the ``- `` line, rest indented
                     items_iter = iter(item.items())
                     first_k, first_v = next(items_iter)
-                    buf += f"{_INDENT * (depth + 1)}- {first_k}: {first_v}\n"
+                    emit(f"{item_prefix}- {first_k}: {first_v}\n")
                     for sub_k, sub_v in items_iter:
-                        buf += f"{_INDENT * (depth + 2)}{sub_k}: {sub_v}\n"
+                        emit(f"{sub_prefix}{sub_k}: {sub_v}\n")
                 else:
-                    buf += f"{_INDENT * (depth + 1)}- {item}\n"
+                    emit(f"{item_prefix}- {item}\n")
         else:
-            buf += f"{prefix}{k}: {v}\n"
-    return buf
+            emit(f"{prefix}{k}: {v}\n")
 
 
 # ---------------------------------------------------------------------------
 # Nested place
 # ---------------------------------------------------------------------------
 
-def _generate_nested(place: GeonPlace, depth: int) -> str:
+def _generate_nested(emit: _Emit, place: GeonPlace, depth: int) -> None:
     """Generate GEON text for a place nested inside CONTAINS."""
-    prefix = _INDENT * depth
-    buf = f"{prefix}- PLACE: {place.place}\n"
+    prefix = _PREFIX[depth]
+    emit(f"{prefix}- PLACE: {place.place}\n")
     inner = depth + 2  # align under the ``- ``
 
     if place.type:
-        buf += _line("TYPE", place.type, inner)
+        _line(emit, "TYPE", place.type, inner)
     if place.location:
-        buf += _line("LOCATION", str(place.location), inner)
+        _line(emit, "LOCATION", place.location, inner)
     if place.area:
-        buf += _line("AREA", place.area, inner)
+        _line(emit, "AREA", place.area, inner)
 
     if place.purpose:
         if len(place.purpose) == 1:
-            buf += _line("PURPOSE", place.purpose[0], inner)
+            _line(emit, "PURPOSE", place.purpose[0], inner)
         else:
-            buf += _section_header("PURPOSE", inner)
-            buf += _list_items(place.purpose, inner + 1)
+            _section_header(emit, "PURPOSE", inner)
+            _list_items(emit, place.purpose, inner + 1)
 
     if place.temporal:
-        buf += _section_header("TEMPORAL", inner)
-        buf += _dict_items(place.temporal, inner + 1)
+        _section_header(emit, "TEMPORAL", inner)
+        _dict_items(emit, place.temporal, inner + 1)
 
     if place.experience:
-        buf += _section_header("EXPERIENCE", inner)
-        buf += _dict_items(place.experience, inner + 1)
-
-    return buf
+        _section_header(emit, "EXPERIENCE", inner)
+        _dict_items(emit, place.experience, inner + 1)
 
 
 # ---------------------------------------------------------------------------
-# Public API
+# Top-level place
 # ---------------------------------------------------------------------------
 
-def generate(place: GeonPlace) -> str:
-    """Serialize a :class:`GeonPlace` to GEON text format.
-
-    >>> from geon.models import GeonPlace, Coordinate
-    >>> p = GeonPlace(place="My Park", type="public_space",
-    ...               location=Coordinate(51.5, -0.1))
-    >>> print(generate(p))
-    PLACE: My Park
-    TYPE: public_space
-    LOCATION: 51.5, -0.1
-    <BLANKLINE>
-    """
-    buf = ""
-
+def _generate_place(emit: _Emit, place: GeonPlace) -> None:
+    """Emit the full GEON text for a top-level place."""
     # --- Identity ---
-    buf += _line("PLACE", place.place)
-    buf += _line("TYPE", place.type)
+    _line(emit, "PLACE", place.place)
+    _line(emit, "TYPE", place.type)
     if place.id:
-        buf += _line("ID", place.id)
+        _line(emit, "ID", place.id)
 
     # --- Geometry ---
     if place.location:
-        buf += _line("LOCATION", str(place.location))
+        _line(emit, "LOCATION", place.location)
     if place.boundary:
-        buf += _section_header("BOUNDARY")
-        buf += _list_items([str(c) for c in place.boundary])
+        _section_header(emit, "BOUNDARY")
+        _coordinate_items(emit, place.boundary)
     if place.extent:
-        buf += _line("EXTENT", str(place.extent))
+        _line(emit, "EXTENT", place.extent)
     if place.elevation:
-        buf += _line("ELEVATION", place.elevation)
+        _line(emit, "ELEVATION", place.elevation)
     if place.area:
-        buf += _line("AREA", place.area)
+        _line(emit, "AREA", place.area)
 
     # --- Semantic ---
     if place.purpose:
-        buf += _section_header("PURPOSE")
-        buf += _list_items(place.purpose)
+        _section_header(emit, "PURPOSE")
+        _list_items(emit, place.purpose)
     if place.experience:
-        buf += _section_header("EXPERIENCE")
-        buf += _dict_items(place.experience)
+        _section_header(emit, "EXPERIENCE")
+        _dict_items(emit, place.experience)
     if place.character:
-        buf += _section_header("CHARACTER")
-        buf += _list_items(place.character)
+        _section_header(emit, "CHARACTER")
+        _list_items(emit, place.character)
 
     # --- Relational ---
     if place.adjacencies:
-        buf += _section_header("ADJACENCIES")
-        buf += _list_items(place.adjacencies)
+        _section_header(emit, "ADJACENCIES")
+        _list_items(emit, place.adjacencies)
     if place.connectivity:
-        buf += _section_header("CONNECTIVITY")
-        buf += _dict_items(place.connectivity)
+        _section_header(emit, "CONNECTIVITY")
+        _dict_items(emit, place.connectivity)
     if place.contains:
-        buf += _section_header("CONTAINS")
+        _section_header(emit, "CONTAINS")
         for child in place.contains:
-            buf += _generate_nested(child, depth=1)
-            buf += "\n"
+            _generate_nested(emit, child, depth=1)
+            emit("\n")
     if place.part_of:
-        buf += _line("PART_OF", place.part_of)
+        _line(emit, "PART_OF", place.part_of)
     if place.viewsheds:
-        buf += _section_header("VIEWSHEDS")
+        _section_header(emit, "VIEWSHEDS")
         if isinstance(place.viewsheds, list):
-            buf += _list_items([str(v) for v in place.viewsheds])
+            _list_items(emit, place.viewsheds)
         elif isinstance(place.viewsheds, dict):
-            buf += _dict_items(place.viewsheds)
+            _dict_items(emit, place.viewsheds)
 
     # --- Temporal ---
     if place.temporal:
-        buf += _section_header("TEMPORAL")
-        buf += _dict_items(place.temporal)
+        _section_header(emit, "TEMPORAL")
+        _dict_items(emit, place.temporal)
     if place.lifespan:
-        buf += _section_header("LIFESPAN")
-        buf += _dict_items(place.lifespan)
+        _section_header(emit, "LIFESPAN")
+        _dict_items(emit, place.lifespan)
 
     # --- Provenance ---
     if place.source:
-        buf += _section_header("SOURCE")
-        buf += _list_items(place.source)
+        _section_header(emit, "SOURCE")
+        _list_items(emit, place.source)
     if place.confidence:
-        buf += _section_header("CONFIDENCE")
-        buf += _dict_items(place.confidence)
+        _section_header(emit, "CONFIDENCE")
+        _dict_items(emit, place.confidence)
     if place.updated:
-        buf += _line("UPDATED", place.updated)
+        _line(emit, "UPDATED", place.updated)
 
     # --- Extended ---
-    for field_name, attr in [
-        ("BUILT_FORM", "built_form"),
-        ("ECOLOGY", "ecology"),
-        ("INFRASTRUCTURE", "infrastructure"),
-        ("DEMOGRAPHICS", "demographics"),
-        ("ECONOMY", "economy"),
-        ("VISUAL", "visual"),
-        ("VERTICAL_PROFILE", "vertical_profile"),
-    ]:
+    for field_name, attr in _EXTENDED_FIELDS:
         data = getattr(place, attr, {})
         if data:
-            buf += _section_header(field_name)
-            buf += _dict_items(data)
+            _section_header(emit, field_name)
+            _dict_items(emit, data)
 
     if place.history:
-        buf += _section_header("HISTORY")
+        _section_header(emit, "HISTORY")
         for entry in place.history:
-            buf += _dict_items(entry)
+            _dict_items(emit, entry)
 
     # --- Extra / unknown fields ---
     for key, value in place.extra.items():
         if isinstance(value, dict):
-            buf += _section_header(key)
-            buf += _dict_items(value)
+            _section_header(emit, key)
+            _dict_items(emit, value)
         elif isinstance(value, list):
-            buf += _section_header(key)
-            buf += _list_items([str(v) for v in value])
+            _section_header(emit, key)
+            _list_items(emit, value)
         else:
-            buf += _line(key, str(value))
+            _line(emit, key, value)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
 
-    return buf
+def generate(place: GeonPlace) -> str:
+    """Serialize a :class:`GeonPlace` to GEON text format.
+
+    >>> from geon.models import GeonPlace, Coordinate
+    >>> p = GeonPlace(place="My Park", type="public_space",
+    ...               location=Coordinate(51.5, -0.1))
+    >>> print(generate(p))
+    PLACE: My Park
+    TYPE: public_space
+    LOCATION: 51.5, -0.1
+    <BLANKLINE>
+    """
+    parts: list[str] = []
+    _generate_place(parts.append, place)
+    return "".join(parts)
+
+
+def generate_to(place: GeonPlace, out: Any) -> None:
+    """Write the GEON text for *place* to *out*, any object with ``write(str)``.
+
+    Fragments are written as they are produced, so serializing many places
+    to an open file never holds a whole document in memory::
+
+        with open("places.geon", "w", encoding="utf-8") as f:
+            for p in places:
+                generate_to(p, f)
+                f.write("\n")
+    """
+    _generate_place(out.write, place)
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Coordinate:
     """A WGS84 coordinate pair (latitude, longitude)."""
 
@@ -16,6 +16,12 @@ class Coordinate:
     def __str__(self) -> str:
         return f"{self.lat}, {self.lon}"
 
+    def __reduce__(self) -> tuple[type[Coordinate], tuple[float, float]]:
+        # Boundaries hold many of these; pickling them as a plain
+        # constructor call (e.g. for parse_many(parallel=True)) is about
+        # twice as fast as the generic slots path.
+        return type(self), (self.lat, self.lon)
+
     def to_geojson_position(self) -> list[float]:
         """Return [longitude, latitude] for GeoJSON."""
         return [self.lon, self.lat]
@@ -25,8 +31,32 @@ class Coordinate:
         """Create from a GeoJSON [lon, lat] position."""
         return cls(lat=position[1], lon=position[0])
 
+    @classmethod
+    def from_array(cls, rows: Any) -> list[Coordinate]:
+        """Create a list of coordinates from ``(lat, lon)`` rows.
+
+        *rows* may be any iterable of pairs, or an array-like with a
+        ``tolist()`` method such as an ``(N, 2)`` NumPy array, which is
+        converted to Python floats in one call.
+        """
+        if hasattr(rows, "tolist"):
+            rows = rows.tolist()
+        return [cls(lat, lon) for lat, lon in rows]
+
+    @classmethod
+    def from_ring(cls, ring: Any) -> list[Coordinate]:
+        """Create a list of coordinates from GeoJSON ``[lon, lat]`` positions.
+
+        The bulk form of :meth:`from_geojson_position` for a whole ring.
+        Positions may carry a third (elevation) value, which is ignored;
+        array-likes are converted with ``tolist()`` as in :meth:`from_array`.
+        """
+        if hasattr(ring, "tolist"):
+            ring = ring.tolist()
+        return [cls(c[1], c[0]) for c in ring]
+
 
-@dataclass
+@dataclass(slots=True)
 class Extent:
     """Bounding box: north, south, east, west."""
 
@@ -39,7 +69,7 @@ class Extent:
         return f"{self.north}, {self.south}, {self.east}, {self.west}"
 
 
-@dataclass
+@dataclass(slots=True)
 class GeonPlace:
     """Core GEON place representation.
 
@@ -10,7 +10,11 @@ of the spec, including:
 
 from __future__ import annotations
 
-import re
+import functools
+import math
+import os
+from array import array
+from collections.abc import Callable, Iterable
 from typing import Any
 
 from .models import Coordinate, Extent, GeonPlace
@@ -19,16 +23,6 @@ from .models import Coordinate, Extent, GeonPlace
 # Low-level helpers
 # ---------------------------------------------------------------------------
 
-_COORD_RE = re.compile(
-    r"^\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*$"
-)
-
-
-def _indent_level(line: str) -> int:
-    """Return number of leading spaces."""
-    return len(line) - len(line.lstrip(" "))
-
-
 def _strip_list_marker(text: str) -> str:
     """Remove leading ``- `` from a list item."""
     stripped = text.lstrip()
@@ -37,197 +31,302 @@ def _strip_list_marker(text: str) -> str:
     return stripped
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_lat_lon(text: str) -> tuple[float, float] | None:
+    """Parse ``lat, lon``; returns None unless both parts are finite numbers.
+
+    Cached: closing vertices and edges shared between nested places repeat
+    the same text. Only the numbers are cached, so every place still gets
+    Coordinate instances of its own.
+    """
+    lat_text, sep, lon_text = text.partition(",")
+    if not sep:
+        return None
+    try:
+        lat = float(lat_text)
+        lon = float(lon_text)
+    except ValueError:
+        return None
+    if not (math.isfinite(lat) and math.isfinite(lon)):
+        return None
+    return lat, lon
+
+
 def _parse_coordinate(text: str) -> Coordinate | None:
-    m = _COORD_RE.match(text)
-    if m:
-        return Coordinate(lat=float(m.group(1)), lon=float(m.group(2)))
-    return None
+    """Parse ``lat, lon`` into a Coordinate; None if it isn't one."""
+    pair = _parse_lat_lon(text)
+    return None if pair is None else Coordinate(*pair)
 
 
 def _split_key_value(line: str) -> tuple[str, str] | None:
     """Split ``KEY: value`` — returns None when there is no colon."""
-    stripped = line.strip()
-    if ":" not in stripped:
+    # The outer strip() already trimmed the far ends of key and value.
+    key, sep, value = line.strip().partition(":")
+    if not sep:
         return None
-    idx = stripped.index(":")
-    key = stripped[:idx].strip()
-    value = stripped[idx + 1:].strip()
-    return key, value
+    return key.rstrip(), value.lstrip()
 
 
 # ---------------------------------------------------------------------------
 # Block builder – turns lines into a tree of dicts / lists
 # ---------------------------------------------------------------------------
 
-def _tokenize_lines(text: str) -> list[tuple[int, str]]:
-    """Return (indent, content) for each non-blank line."""
-    results: list[tuple[int, str]] = []
-    for raw in text.splitlines():
-        if not raw.strip():
-            continue
-        results.append((_indent_level(raw), raw.strip()))
-    return results
-
-
-def _parse_block(lines: list[tuple[int, str]], start: int, base_indent: int) -> tuple[dict[str, Any], int]:
-    """Recursively parse an indented block into a dict.
+def _tokenize_lines(text: str | Iterable[str]) -> tuple[array[int], list[str]]:
+    """Return parallel (indents, contents) for the non-blank lines.
 
-    Returns (parsed_dict, next_line_index).
+    *text* is either a whole document or an iterable of lines (such as an
+    open file), which is consumed one line at a time. Indents are kept in
+    an unboxed ``array`` rather than paired with their line in a tuple.
     """
-    result: dict[str, Any] = {}
-    i = start
-    while i < len(lines):
-        indent, content = lines[i]
-        if indent < base_indent:
-            break
-
-        if indent > base_indent:
-            # Belongs to previous key – skip (handled below when key is set)
-            i += 1
-            continue
-
-        kv = _split_key_value(content)
-        if kv is None:
-            # Plain text line at this level – skip
-            i += 1
-            continue
-
-        key, value = kv
-
-        if value:
-            # Simple key: value on one line
-            result[key] = value
-            i += 1
-        else:
-            # Key with no inline value → children follow
-            children, i = _collect_children(lines, i + 1, base_indent + 2)
-            result[key] = children
-
-    return result, i
-
-
-def _collect_children(lines: list[tuple[int, str]], start: int, child_indent: int) -> tuple[Any, int]:
-    """Collect the children of a key that had no inline value.
-
-    Children may be a list (if they start with ``-``) or a dict of sub-keys.
+    if isinstance(text, str):
+        text = text.splitlines()
+    indents = array("i")
+    contents: list[str] = []
+    add_indent = indents.append
+    add_content = contents.append
+    for raw in text:
+        # Measure the indent and strip the line from a single lstrip().
+        body = raw.lstrip(" ")
+        content = body.strip()
+        if content:
+            add_indent(len(raw) - len(body))
+            add_content(content)
+    return indents, contents
+
+
+# Frame kinds for _build(). A BLOCK frame reads ``KEY: value`` lines at one
+# indent into a dict; a CHILDREN frame reads the lines under a key that had
+# no inline value, as either a list (``- item``) or a dict of sub-keys.
+_BLOCK, _CHILDREN = 0, 1
+
+# How a finished frame hands its value back to the frame below it.
+_TO_KEY, _APPEND, _ATTACH = 0, 1, 2
+
+
+class _Frame:
+    __slots__ = ("kind", "i", "hi", "indent", "offset", "result", "items",
+                 "is_list", "sink", "target", "key")
+
+    def __init__(self, kind: int, i: int, hi: int, indent: int, offset: int,
+                 sink: int = _TO_KEY, target: Any = None, key: str = "") -> None:
+        self.kind = kind
+        self.i = i            # next token to read
+        self.hi = hi          # end of this frame's token range
+        self.indent = indent  # indent this frame reads at (relative to offset)
+        self.offset = offset  # re-bases nested PLACE blocks to indent 0
+        self.result: dict[str, Any] = {}
+        self.items: list[Any] = []
+        self.is_list = False
+        self.sink = sink
+        self.target = target  # container (or frame) receiving the value
+        self.key = key
+
+
+def _build(indents: array[int], contents: list[str],
+           start: int = 0, end: int | None = None) -> dict[str, Any]:
+    """Build the raw dict/list tree for lines ``start:end`` of a tokenized text.
+
+    A single pass over the lines driven by an explicit stack of frames. Nested
+    PLACE blocks and the sub-keys of list items are read in place, with an
+    indent offset and an end index, instead of slicing and re-indenting
+    copies of the token list.
     """
-    if start >= len(lines):
-        return [], start
-
-    items: list[Any] = []
-    mapping: dict[str, Any] = {}
-    i = start
-    is_list = False
-
-    while i < len(lines):
-        indent, content = lines[i]
-        if indent < child_indent:
-            break
-
-        if indent == child_indent:
-            if content.startswith("- "):
-                is_list = True
-                item_text = content[2:].strip()
-
-                # Check if this list item is a nested PLACE block
-                kv = _split_key_value(item_text)
-                if kv and kv[0] == "PLACE":
-                    # Nested GEON block – gather all indented lines under it
-                    j = i + 1
-                    while j < len(lines) and lines[j][0] > child_indent:
-                        j += 1
-                    # Determine the indent of nested fields so we can re-base to 0
-                    child_lines = lines[i + 1:j]
-                    if child_lines:
-                        field_indent = child_lines[0][0]
-                    else:
-                        field_indent = child_indent + 2
-                    rebased = [(0, item_text)] + [
-                        (ind - field_indent, c) for ind, c in child_lines
-                    ]
-                    nested_block, _ = _parse_block(rebased, 0, 0)
-                    items.append(nested_block)
-                    i = j
-                    continue
-                else:
-                    items.append(item_text)
+    root = _Frame(_BLOCK, start, len(contents) if end is None else end, 0, 0)
+    stack = [root]
+    while stack:
+        f = stack[-1]
+        child = None
+        i, hi, offset, indent_at = f.i, f.hi, f.offset, f.indent
+
+        if f.kind == _BLOCK:
+            result = f.result
+            while i < hi:
+                indent = indents[i] - offset
+                content = contents[i]
+                if indent < indent_at:
+                    break
+                if indent > indent_at:
+                    # Belongs to previous key – skip (handled via its children)
                     i += 1
-            else:
+                    continue
                 kv = _split_key_value(content)
-                if kv:
-                    key, value = kv
-                    if value:
-                        mapping[key] = value
+                if kv is None:
+                    # Plain text line at this level – skip
+                    i += 1
+                    continue
+                key, value = kv
+                if value:
+                    # Simple key: value on one line
+                    result[key] = value
+                    i += 1
+                else:
+                    # Key with no inline value → children follow
+                    child = _Frame(_CHILDREN, i + 1, hi, indent_at + 2, offset,
+                                   _TO_KEY, f, key)
+                    break
+        else:
+            items = f.items
+            mapping = f.result
+            while i < hi:
+                indent = indents[i] - offset
+                content = contents[i]
+                if indent < indent_at:
+                    break
+
+                if indent == indent_at:
+                    if content.startswith("- "):
+                        f.is_list = True
+                        item_text = content[2:].strip()
+
+                        # Check if this list item is a nested PLACE block
+                        kv = _split_key_value(item_text)
+                        if kv and kv[0] == "PLACE":
+                            # Its fields are every deeper line that follows;
+                            # re-base them so the first one sits at indent 0.
+                            j = i + 1
+                            while j < hi and indents[j] - offset > indent_at:
+                                j += 1
+                            if j > i + 1:
+                                field_offset = indents[i + 1]
+                            else:
+                                field_offset = offset + indent_at + 2
+                            child = _Frame(_BLOCK, i + 1, j, 0, field_offset,
+                                           _APPEND, items)
+                            if kv[1]:
+                                child.result["PLACE"] = kv[1]
+                            else:
+                                # "- PLACE:" with its own children
+                                stack.append(child)
+                                child = _Frame(_CHILDREN, i + 1, j, 2, field_offset,
+                                               _TO_KEY, child, "PLACE")
+                            i = j
+                            break
+                        items.append(item_text)
                         i += 1
                     else:
-                        sub, i = _collect_children(lines, i + 1, child_indent + 2)
-                        mapping[key] = sub
+                        kv = _split_key_value(content)
+                        if kv:
+                            key, value = kv
+                            if value:
+                                mapping[key] = value
+                                i += 1
+                            else:
+                                child = _Frame(_CHILDREN, i + 1, hi, indent_at + 2,
+                                               offset, _TO_KEY, f, key)
+                                break
+                        else:
+                            i += 1
+                elif f.is_list and items:
+                    # Sub-keys of the last list item – read as a nested block
+                    j = i
+                    while j < hi and indents[j] - offset > indent_at:
+                        j += 1
+                    child = _Frame(_BLOCK, i, j, indent, offset, _ATTACH, items)
+                    i = j
+                    break
                 else:
                     i += 1
-        elif indent > child_indent:
-            # Sub-children of the last list item – handle as nested block
-            if is_list and items:
-                sub_items: list[tuple[int, str]] = []
-                j = i
-                while j < len(lines) and lines[j][0] > child_indent:
-                    sub_items.append(lines[j])
-                    j += 1
-                # Attach as dict to last list item
-                if sub_items:
-                    sub_block, _ = _parse_block(sub_items, 0, sub_items[0][0])
-                    if isinstance(items[-1], str):
-                        kv2 = _split_key_value(items[-1])
-                        if kv2:
-                            items[-1] = {kv2[0]: kv2[1], **sub_block}
-                        else:
-                            items[-1] = {"_value": items[-1], **sub_block}
-                    elif isinstance(items[-1], dict):
-                        items[-1].update(sub_block)
-                i = j
-            else:
-                i += 1
+
+        f.i = i
+        if child is not None:
+            stack.append(child)
+            continue
+
+        # Frame finished: hand its value to the frame below.
+        stack.pop()
+        if f.kind == _BLOCK:
+            value = f.result
+        elif f.is_list or not f.result:
+            value = f.items
+        else:
+            value = f.result
+
+        if f.sink == _TO_KEY:
+            if f.target is None:
+                return value
+            parent = f.target
+            parent.result[f.key] = value
+            parent.i = i
+        elif f.sink == _APPEND:
+            f.target.append(value)
         else:
-            i += 1
+            last = f.target[-1]
+            if isinstance(last, str):
+                kv2 = _split_key_value(last)
+                if kv2:
+                    f.target[-1] = {kv2[0]: kv2[1], **value}
+                else:
+                    f.target[-1] = {"_value": last, **value}
+            elif isinstance(last, dict):
+                last.update(value)
+
+    return root.result
+
 
-    if is_list:
-        return items, i
-    if mapping:
-        return mapping, i
-    return items, i
+# Use the compiled tokenizer/builder when the optional extension is built
+# (see _parser_c.pyx); the definitions above are the reference versions.
+try:
+    from ._parser_c import _build, _tokenize_lines
+except ImportError:
+    pass
 
 
 # ---------------------------------------------------------------------------
 # High-level: raw dict → GeonPlace
 # ---------------------------------------------------------------------------
 
-def _raw_to_place(raw: dict[str, Any]) -> GeonPlace:
-    """Convert a raw parsed dict into a GeonPlace dataclass."""
-    p = GeonPlace()
+def _set(attr: str) -> Callable[[GeonPlace, Any], None]:
+    """Handler that stores the raw value on *attr* unchanged."""
+    def handler(p: GeonPlace, value: Any) -> None:
+        setattr(p, attr, value)
+    return handler
+
+
+def _set_flat_dict(attr: str) -> Callable[[GeonPlace, Any], None]:
+    """Handler for dict sections whose single-item lists are flattened."""
+    def handler(p: GeonPlace, value: Any) -> None:
+        if isinstance(value, dict):
+            setattr(p, attr, {k: _flatten_value(v) for k, v in value.items()})
+    return handler
+
+
+def _set_str_dict(attr: str) -> Callable[[GeonPlace, Any], None]:
+    """Handler for dict sections whose values are all strings."""
+    def handler(p: GeonPlace, value: Any) -> None:
+        if isinstance(value, dict):
+            setattr(p, attr, {k: str(v) for k, v in value.items()})
+    return handler
+
 
-    p.place = raw.get("PLACE", "")
-    p.type = raw.get("TYPE", "")
-    p.id = raw.get("ID")
+def _set_str_list(attr: str, allow_scalar: bool = False) -> Callable[[GeonPlace, Any], None]:
+    """Handler for list sections; a single inline value is wrapped if allowed."""
+    def handler(p: GeonPlace, value: Any) -> None:
+        if isinstance(value, list):
+            setattr(p, attr, [str(x) for x in value])
+        elif allow_scalar and isinstance(value, str):
+            setattr(p, attr, [value])
+    return handler
 
-    # Location
-    loc_str = raw.get("LOCATION", "")
-    if loc_str:
-        coord = _parse_coordinate(loc_str)
+
+def _apply_location(p: GeonPlace, value: Any) -> None:
+    # A LOCATION block (list/dict) is not a coordinate, and isn't hashable
+    # for the _parse_lat_lon cache either.
+    if value and isinstance(value, str):
+        coord = _parse_coordinate(value)
         if coord:
             p.location = coord
 
-    # Boundary
-    boundary_raw = raw.get("BOUNDARY", [])
-    if isinstance(boundary_raw, list):
-        for item in boundary_raw:
-            text = item if isinstance(item, str) else str(item)
-            coord = _parse_coordinate(text)
-            if coord:
-                p.boundary.append(coord)
-
-    # Extent
-    extent_str = raw.get("EXTENT", "")
-    if extent_str:
-        parts = [x.strip() for x in extent_str.split(",")]
+
+def _apply_boundary(p: GeonPlace, value: Any) -> None:
+    if isinstance(value, list):
+        pairs = [_parse_lat_lon(item if isinstance(item, str) else str(item))
+                 for item in value]
+        p.boundary = [Coordinate(*pair) for pair in pairs if pair is not None]
+
+
+def _apply_extent(p: GeonPlace, value: Any) -> None:
+    if value:
+        parts = [x.strip() for x in value.split(",")]
         if len(parts) == 4:
             try:
                 p.extent = Extent(
@@ -239,115 +338,90 @@ def _raw_to_place(raw: dict[str, Any]) -> GeonPlace:
             except ValueError:
                 pass
 
-    p.elevation = raw.get("ELEVATION")
-    p.area = raw.get("AREA")
-
-    # Purpose
-    purpose_raw = raw.get("PURPOSE", [])
-    if isinstance(purpose_raw, list):
-        p.purpose = [str(x) for x in purpose_raw]
-    elif isinstance(purpose_raw, str):
-        p.purpose = [purpose_raw]
-
-    # Experience
-    exp_raw = raw.get("EXPERIENCE", {})
-    if isinstance(exp_raw, dict):
-        p.experience = {k: str(v) for k, v in exp_raw.items()}
-
-    # Character
-    char_raw = raw.get("CHARACTER", [])
-    if isinstance(char_raw, list):
-        p.character = [str(x) for x in char_raw]
-
-    # Adjacencies
-    adj_raw = raw.get("ADJACENCIES", [])
-    if isinstance(adj_raw, list):
-        p.adjacencies = [str(x) for x in adj_raw]
-
-    # Connectivity
-    conn_raw = raw.get("CONNECTIVITY", {})
-    if isinstance(conn_raw, dict):
-        p.connectivity = {k: _flatten_value(v) for k, v in conn_raw.items()}
-    elif isinstance(conn_raw, list):
-        p.connectivity = {str(i): str(x) for i, x in enumerate(conn_raw)}
-
-    # Contains (nested places)
-    contains_raw = raw.get("CONTAINS", [])
-    if isinstance(contains_raw, list):
-        for item in contains_raw:
+
+def _apply_connectivity(p: GeonPlace, value: Any) -> None:
+    if isinstance(value, dict):
+        p.connectivity = {k: _flatten_value(v) for k, v in value.items()}
+    elif isinstance(value, list):
+        p.connectivity = {str(i): str(x) for i, x in enumerate(value)}
+
+
+def _apply_contains(p: GeonPlace, value: Any) -> None:
+    # Nested places
+    if isinstance(value, list):
+        for item in value:
             if isinstance(item, dict) and "PLACE" in item:
                 p.contains.append(_raw_to_place(item))
             elif isinstance(item, str):
                 child = GeonPlace(place=item)
                 p.contains.append(child)
 
-    p.part_of = raw.get("PART_OF")
-
-    # Viewsheds
-    vs_raw = raw.get("VIEWSHEDS", [])
-    if isinstance(vs_raw, list):
-        p.viewsheds = [str(x) if isinstance(x, str) else x for x in vs_raw]
-    elif isinstance(vs_raw, dict):
-        p.viewsheds = vs_raw
-
-    # Temporal
-    temp_raw = raw.get("TEMPORAL", {})
-    if isinstance(temp_raw, dict):
-        p.temporal = {k: _flatten_value(v) for k, v in temp_raw.items()}
 
-    # Lifespan
-    ls_raw = raw.get("LIFESPAN", {})
-    if isinstance(ls_raw, dict):
-        p.lifespan = {k: str(v) for k, v in ls_raw.items()}
+def _apply_viewsheds(p: GeonPlace, value: Any) -> None:
+    if isinstance(value, list):
+        p.viewsheds = [str(x) if isinstance(x, str) else x for x in value]
+    elif isinstance(value, dict):
+        p.viewsheds = value
 
-    # Source
-    src_raw = raw.get("SOURCE", [])
-    if isinstance(src_raw, list):
-        p.source = [str(x) for x in src_raw]
-    elif isinstance(src_raw, str):
-        p.source = [src_raw]
 
-    # Confidence
-    conf_raw = raw.get("CONFIDENCE", {})
-    if isinstance(conf_raw, dict):
-        p.confidence = {k: str(v) for k, v in conf_raw.items()}
+def _apply_history(p: GeonPlace, value: Any) -> None:
+    if isinstance(value, list):
+        for item in value:
+            if isinstance(item, dict):
+                p.history.append(item)
 
-    p.updated = raw.get("UPDATED")
 
+# GEON key -> handler that stores the raw parsed value on a GeonPlace.
+# Keys not listed here are kept verbatim in ``GeonPlace.extra``.
+_FIELD_HANDLERS: dict[str, Callable[[GeonPlace, Any], None]] = {
+    # Identity
+    "PLACE": _set("place"),
+    "TYPE": _set("type"),
+    "ID": _set("id"),
+    # Geometry
+    "LOCATION": _apply_location,
+    "BOUNDARY": _apply_boundary,
+    "EXTENT": _apply_extent,
+    "ELEVATION": _set("elevation"),
+    "AREA": _set("area"),
+    # Semantic
+    "PURPOSE": _set_str_list("purpose", allow_scalar=True),
+    "EXPERIENCE": _set_str_dict("experience"),
+    "CHARACTER": _set_str_list("character"),
+    # Relational
+    "ADJACENCIES": _set_str_list("adjacencies"),
+    "CONNECTIVITY": _apply_connectivity,
+    "CONTAINS": _apply_contains,
+    "PART_OF": _set("part_of"),
+    "VIEWSHEDS": _apply_viewsheds,
+    # Temporal
+    "TEMPORAL": _set_flat_dict("temporal"),
+    "LIFESPAN": _set_str_dict("lifespan"),
+    # Provenance
+    "SOURCE": _set_str_list("source", allow_scalar=True),
+    "CONFIDENCE": _set_str_dict("confidence"),
+    "UPDATED": _set("updated"),
     # Extended domain fields
-    for field_name, attr in [
-        ("BUILT_FORM", "built_form"),
-        ("ECOLOGY", "ecology"),
-        ("INFRASTRUCTURE", "infrastructure"),
-        ("DEMOGRAPHICS", "demographics"),
-        ("ECONOMY", "economy"),
-        ("VISUAL", "visual"),
-        ("VERTICAL_PROFILE", "vertical_profile"),
-    ]:
-        val = raw.get(field_name, {})
-        if isinstance(val, dict):
-            setattr(p, attr, {k: _flatten_value(v) for k, v in val.items()})
-
-    # History
-    hist_raw = raw.get("HISTORY", [])
-    if isinstance(hist_raw, list):
-        for item in hist_raw:
-            if isinstance(item, dict):
-                p.history.append(item)
+    "BUILT_FORM": _set_flat_dict("built_form"),
+    "ECOLOGY": _set_flat_dict("ecology"),
+    "INFRASTRUCTURE": _set_flat_dict("infrastructure"),
+    "DEMOGRAPHICS": _set_flat_dict("demographics"),
+    "ECONOMY": _set_flat_dict("economy"),
+    "VISUAL": _set_flat_dict("visual"),
+    "VERTICAL_PROFILE": _set_flat_dict("vertical_profile"),
+    "HISTORY": _apply_history,
+}
 
-    # Collect unknown fields into extra
-    known = {
-        "PLACE", "TYPE", "ID", "LOCATION", "BOUNDARY", "EXTENT", "ELEVATION",
-        "AREA", "PURPOSE", "EXPERIENCE", "CHARACTER", "ADJACENCIES",
-        "CONNECTIVITY", "CONTAINS", "PART_OF", "VIEWSHEDS", "TEMPORAL",
-        "LIFESPAN", "SOURCE", "CONFIDENCE", "UPDATED", "BUILT_FORM",
-        "ECOLOGY", "INFRASTRUCTURE", "DEMOGRAPHICS", "ECONOMY", "VISUAL",
-        "HISTORY", "VERTICAL_PROFILE",
-    }
-    for k, v in raw.items():
-        if k not in known:
-            p.extra[k] = v
 
+def _raw_to_place(raw: dict[str, Any]) -> GeonPlace:
+    """Convert a raw parsed dict into a GeonPlace dataclass."""
+    p = GeonPlace()
+    for key, value in raw.items():
+        handler = _FIELD_HANDLERS.get(key)
+        if handler is None:
+            p.extra[key] = value
+        else:
+            handler(p, value)
     return p
 
 
@@ -370,28 +444,67 @@ def parse(text: str) -> GeonPlace:
     >>> p.place
     'My Park'
     """
-    tokens = _tokenize_lines(text)
-    if not tokens:
+    indents, contents = _tokenize_lines(text)
+    if not contents:
         return GeonPlace()
-    raw, _ = _parse_block(tokens, 0, 0)
+    raw = _build(indents, contents)
     return _raw_to_place(raw)
 
 
-def parse_many(text: str) -> list[GeonPlace]:
-    """Parse a multi-document GEON text (documents separated by blank lines
-    where a new top-level PLACE: starts) into a list of :class:`GeonPlace`.
+def parse_file(path: str | os.PathLike[str], encoding: str = "utf-8") -> GeonPlace:
+    """Parse a ``.geon`` file into a :class:`GeonPlace`.
+
+    The file is read line by line, so the whole document is never held in
+    memory as a single string.
     """
-    chunks: list[str] = []
-    current_lines: list[str] = []
+    with open(path, encoding=encoding) as f:
+        indents, contents = _tokenize_lines(f)
+    if not contents:
+        return GeonPlace()
+    raw = _build(indents, contents)
+    return _raw_to_place(raw)
+
+
+# Below this many documents, parse_many(parallel=True) stays in-process:
+# pickling tokens out and places back costs more than it saves.
+PARALLEL_MIN_DOCS = 64
 
-    for line in text.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("PLACE:") and _indent_level(line) == 0 and current_lines:
-            chunks.append("\n".join(current_lines))
-            current_lines = []
-        current_lines.append(line)
 
-    if current_lines:
-        chunks.append("\n".join(current_lines))
+def _parse_tokens(indents: array[int], contents: list[str]) -> GeonPlace:
+    """Worker for parse_many(parallel=True): build one pre-tokenized document."""
+    return _raw_to_place(_build(indents, contents))
 
-    return [parse(chunk) for chunk in chunks]
+
+def parse_many(text: str, parallel: bool = False,
+               max_workers: int | None = None) -> list[GeonPlace]:
+    """Parse a multi-document GEON text (documents separated by blank lines
+    where a new top-level PLACE: starts) into a list of :class:`GeonPlace`.
+
+    The text is tokenized once and each document is built from its own
+    range of lines. With ``parallel=True`` and at least
+    :data:`PARALLEL_MIN_DOCS` documents, the documents are built across a
+    process pool of *max_workers* processes (default: one per CPU); the
+    result is the same list, in the same order.
+    """
+    indents, contents = _tokenize_lines(text)
+    if not contents:
+        return []
+    starts = [i for i, (indent, content) in enumerate(zip(indents, contents))
+              if indent == 0 and content.startswith("PLACE:")]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    ends = starts[1:] + [len(contents)]
+    if not parallel or len(starts) < PARALLEL_MIN_DOCS:
+        return [_raw_to_place(_build(indents, contents, lo, hi)) for lo, hi in zip(starts, ends)]
+
+    # Imported here: concurrent.futures is only needed on this path.
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as pool:
+        return list(pool.map(
+            _parse_tokens,
+            [indents[lo:hi] for lo, hi in zip(starts, ends)],
+            [contents[lo:hi] for lo, hi in zip(starts, ends)],
+            chunksize=max(1, len(starts) // (workers * 4)),
+        ))
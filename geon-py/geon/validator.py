@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -15,13 +17,21 @@ from .vocab import (
 )
 
 
+# Lookup forms of the vocabularies, built once at import: frozensets for
+# membership tests, and the vocabulary listings quoted in warning messages
+# pre-rendered in the same list format they have always used.
+_PLACE_TYPES_MSG = str(sorted(PLACE_TYPES))
+_EXPERIENCE_VALUES = {key: frozenset(scale) for key, scale in EXPERIENCE_SCALES.items()}
+_EXPERIENCE_MSGS = {key: str(list(scale)) for key, scale in EXPERIENCE_SCALES.items()}
+
+
 class Severity(Enum):
     ERROR = "error"
     WARNING = "warning"
     INFO = "info"
 
 
-@dataclass
+@dataclass(slots=True)
 class Issue:
     severity: Severity
     field: str
@@ -31,22 +41,108 @@ class Issue:
         return f"[{self.severity.value}] {self.field}: {self.message}"
 
 
-@dataclass
+def _rebuckets(method):
+    """Wrap a list method that can drop, replace or reorder issues."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        out = method(self, *args, **kwargs)
+        self._rebucket()
+        return out
+
+    return wrapper
+
+
+class IssueList(list):
+    """A list of issues that also keeps them bucketed by severity.
+
+    ``append``/``extend`` file each new issue into its bucket as it arrives;
+    operations that insert, drop, replace or reorder issues re-bucket the
+    whole list, so the buckets always match the list in content and order.
+    """
+
+    __slots__ = ("_errors", "_warnings", "_info")
+
+    def __init__(self, issues: Iterable[Issue] = ()) -> None:
+        super().__init__()
+        self._errors: list[Issue] = []
+        self._warnings: list[Issue] = []
+        self._info: list[Issue] = []
+        self.extend(issues)
+
+    def __reduce__(self) -> tuple[type[IssueList], tuple[list[Issue]]]:
+        # The default list-subclass pickle appends items before restoring
+        # slots; rebuild through __init__ instead.
+        return type(self), (list(self),)
+
+    def _bucket(self, issue: Issue) -> list[Issue]:
+        severity = issue.severity
+        if severity is Severity.ERROR:
+            return self._errors
+        if severity is Severity.WARNING:
+            return self._warnings
+        return self._info
+
+    def _rebucket(self) -> None:
+        self._errors.clear()
+        self._warnings.clear()
+        self._info.clear()
+        for issue in self:
+            self._bucket(issue).append(issue)
+
+    def append(self, issue: Issue) -> None:
+        super().append(issue)
+        self._bucket(issue).append(issue)
+
+    def extend(self, issues: Iterable[Issue]) -> None:
+        for issue in issues:
+            self.append(issue)
+
+    def __iadd__(self, issues: Iterable[Issue]) -> IssueList:
+        self.extend(issues)
+        return self
+
+    insert = _rebuckets(list.insert)
+    remove = _rebuckets(list.remove)
+    pop = _rebuckets(list.pop)
+    clear = _rebuckets(list.clear)
+    sort = _rebuckets(list.sort)
+    reverse = _rebuckets(list.reverse)
+    __setitem__ = _rebuckets(list.__setitem__)
+    __delitem__ = _rebuckets(list.__delitem__)
+    __imul__ = _rebuckets(list.__imul__)
+
+
+@dataclass(slots=True)
 class ValidationResult:
-    issues: list[Issue] = field(default_factory=list)
+    """Issues in the order they were found.
+
+    ``issues`` is an :class:`IssueList`, so ``valid``, ``errors`` and
+    ``warnings`` read its severity buckets without rescanning, and issues
+    appended to it directly count as well.
+    """
+
+    issues: IssueList = field(default_factory=IssueList)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.issues, IssueList):
+            self.issues = IssueList(self.issues)
+
+    def add(self, issue: Issue) -> None:
+        self.issues.append(issue)
 
     @property
     def valid(self) -> bool:
         """True when there are no ERROR-level issues."""
-        return not any(i.severity == Severity.ERROR for i in self.issues)
+        return not self.issues._errors
 
     @property
     def errors(self) -> list[Issue]:
-        return [i for i in self.issues if i.severity == Severity.ERROR]
+        return list(self.issues._errors)
 
     @property
     def warnings(self) -> list[Issue]:
-        return [i for i in self.issues if i.severity == Severity.WARNING]
+        return list(self.issues._warnings)
 
     def __str__(self) -> str:
         if not self.issues:
@@ -58,63 +154,64 @@ class ValidationResult:
 # Validators
 # ---------------------------------------------------------------------------
 
-def _check_required(place: GeonPlace, result: ValidationResult) -> None:
+def _check_required(place: GeonPlace, result: ValidationResult, prefix: str) -> None:
     if not place.place:
-        result.issues.append(Issue(Severity.ERROR, "PLACE", "Required field PLACE is missing or empty"))
+        result.add(Issue(Severity.ERROR, prefix + "PLACE", "Required field PLACE is missing or empty"))
     if not place.type:
-        result.issues.append(Issue(Severity.ERROR, "TYPE", "Required field TYPE is missing or empty"))
+        result.add(Issue(Severity.ERROR, prefix + "TYPE", "Required field TYPE is missing or empty"))
     if place.location is None:
-        result.issues.append(Issue(Severity.ERROR, "LOCATION", "Required field LOCATION is missing"))
+        result.add(Issue(Severity.ERROR, prefix + "LOCATION", "Required field LOCATION is missing"))
 
 
-def _check_type_vocab(place: GeonPlace, result: ValidationResult) -> None:
+def _check_type_vocab(place: GeonPlace, result: ValidationResult, prefix: str) -> None:
     if place.type and place.type not in PLACE_TYPES:
-        result.issues.append(
-            Issue(Severity.WARNING, "TYPE", f"Type '{place.type}' is not in the controlled vocabulary: {sorted(PLACE_TYPES)}")
+        result.add(
+            Issue(Severity.WARNING, prefix + "TYPE", f"Type '{place.type}' is not in the controlled vocabulary: {_PLACE_TYPES_MSG}")
         )
 
 
-def _check_location_range(place: GeonPlace, result: ValidationResult) -> None:
+def _check_location_range(place: GeonPlace, result: ValidationResult, prefix: str) -> None:
     if place.location:
         if not (-90 <= place.location.lat <= 90):
-            result.issues.append(
-                Issue(Severity.ERROR, "LOCATION", f"Latitude {place.location.lat} is out of range [-90, 90]")
+            result.add(
+                Issue(Severity.ERROR, prefix + "LOCATION", f"Latitude {place.location.lat} is out of range [-90, 90]")
             )
         if not (-180 <= place.location.lon <= 180):
-            result.issues.append(
-                Issue(Severity.ERROR, "LOCATION", f"Longitude {place.location.lon} is out of range [-180, 180]")
+            result.add(
+                Issue(Severity.ERROR, prefix + "LOCATION", f"Longitude {place.location.lon} is out of range [-180, 180]")
             )
 
 
-def _check_boundary_closed(place: GeonPlace, result: ValidationResult) -> None:
+def _check_boundary_closed(place: GeonPlace, result: ValidationResult, prefix: str) -> None:
     if len(place.boundary) >= 3:
         first = place.boundary[0]
         last = place.boundary[-1]
         if first.lat != last.lat or first.lon != last.lon:
-            result.issues.append(
-                Issue(Severity.WARNING, "BOUNDARY", "Boundary polygon is not closed (first and last coordinates differ)")
+            result.add(
+                Issue(Severity.WARNING, prefix + "BOUNDARY", "Boundary polygon is not closed (first and last coordinates differ)")
             )
 
 
-def _check_experience_vocab(place: GeonPlace, result: ValidationResult) -> None:
+def _check_experience_vocab(place: GeonPlace, result: ValidationResult, prefix: str) -> None:
     for key, value in place.experience.items():
-        if key in EXPERIENCE_SCALES:
+        allowed = _EXPERIENCE_VALUES.get(key)
+        if allowed is not None:
             # Value might contain qualifiers like "moderate (daytime)" — check base value
-            base = value.split("(")[0].strip().split(",")[0].strip()
+            base = value.partition("(")[0].partition(",")[0].strip()
             # Allow compound values like "medium-high"
             if "-" in base:
                 continue
-            if base not in EXPERIENCE_SCALES[key]:
-                result.issues.append(
+            if base not in allowed:
+                result.add(
                     Issue(
                         Severity.WARNING,
-                        f"EXPERIENCE.{key}",
-                        f"Value '{base}' is not in the controlled vocabulary: {list(EXPERIENCE_SCALES[key])}",
+                        f"{prefix}EXPERIENCE.{key}",
+                        f"Value '{base}' is not in the controlled vocabulary: {_EXPERIENCE_MSGS[key]}",
                     )
                 )
 
 
-def _check_recommended(place: GeonPlace, result: ValidationResult) -> None:
+def _check_recommended(place: GeonPlace, result: ValidationResult, prefix: str) -> None:
     field_map = {
         "PURPOSE": place.purpose,
         "EXPERIENCE": place.experience,
@@ -125,17 +222,31 @@ def _check_recommended(place: GeonPlace, result: ValidationResult) -> None:
     for name in RECOMMENDED_FIELDS:
         value = field_map.get(name)
         if not value:
-            result.issues.append(
-                Issue(Severity.INFO, name, f"Recommended field {name} is empty")
+            result.add(
+                Issue(Severity.INFO, prefix + name, f"Recommended field {name} is empty")
             )
 
 
-def _check_children(place: GeonPlace, result: ValidationResult) -> None:
+def _check_children(place: GeonPlace, result: ValidationResult, prefix: str) -> None:
     for i, child in enumerate(place.contains):
-        child_result = validate(child)
-        for issue in child_result.issues:
-            issue.field = f"CONTAINS[{i}].{issue.field}"
-            result.issues.append(issue)
+        _validate_into(child, result, f"{prefix}CONTAINS[{i}].")
+
+
+def _validate_into(place: GeonPlace, result: ValidationResult, prefix: str) -> None:
+    """Run every check on *place*, adding its issues to *result*.
+
+    Each issue's field is *prefix* (e.g. ``"CONTAINS[0]."``, empty at the
+    top level) plus the field name. Nested places are validated into the
+    same result with a longer prefix, so no per-child result is built and
+    no issue is re-tagged on the way back up.
+    """
+    _check_required(place, result, prefix)
+    _check_type_vocab(place, result, prefix)
+    _check_location_range(place, result, prefix)
+    _check_boundary_closed(place, result, prefix)
+    _check_experience_vocab(place, result, prefix)
+    _check_recommended(place, result, prefix)
+    _check_children(place, result, prefix)
 
 
 # ---------------------------------------------------------------------------
@@ -154,11 +265,5 @@ def validate(place: GeonPlace) -> ValidationResult:
     - Recursive validation of nested CONTAINS places
     """
     result = ValidationResult()
-    _check_required(place, result)
-    _check_type_vocab(place, result)
-    _check_location_range(place, result)
-    _check_boundary_closed(place, result)
-    _check_experience_vocab(place, result)
-    _check_recommended(place, result)
-    _check_children(place, result)
+    _validate_into(place, result, "")
     return result
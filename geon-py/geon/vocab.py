@@ -6,7 +6,7 @@ from __future__ import annotations
 # 3.1  Place Types
 # ---------------------------------------------------------------------------
 
-PLACE_TYPES: set[str] = {
+PLACE_TYPES: frozenset[str] = frozenset({
     "public_space",
     "street",
     "building",
@@ -17,7 +17,7 @@ PLACE_TYPES: set[str] = {
     "landmark",
     "threshold",
     "hybrid",
-}
+})
 
 # ---------------------------------------------------------------------------
 # 3.2  Experiential Qualities
@@ -0,0 +1,20 @@
+"""Build hook for the optional compiled parser.
+
+Project metadata lives in pyproject.toml. When Cython is importable at
+build time, geon/_parser_c.pyx is compiled as ``geon._parser_c``;
+otherwise, or if compilation fails, geon installs as pure Python.
+"""
+
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [Extension("geon._parser_c", ["geon/_parser_c.pyx"], optional=True)],
+        language_level=3,
+    )
+
+setup(ext_modules=ext_modules)